@@ -4,19 +4,99 @@ Includes retry logic, exponential backoff, and response mapping.
 """
 
 import time
+import json
+import random
+import hashlib
 import logging
-from typing import Dict, List, Any, Optional
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Any, Optional
 import requests
+from requests.adapters import HTTPAdapter
 
 from config import config, load_config
 from utils import (
     setup_logging, chunk_list, flatten_list_to_string,
-    safe_str, safe_int, mask_pii, extract_domain
+    safe_str, safe_int, mask_pii, extract_domain, json_loads, json_dumps_bytes
 )
 
 logger = setup_logging(config.LOG_LEVEL, config.LOG_FILE,
                        config.LOG_TO_CONSOLE)
 
+# Process-wide session shared by all ApolloClient instances so TLS connections
+# to the API survive across clients (e.g. one client per scrape request).
+# Retries are handled by _make_request, so the adapter itself never retries.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=0))
+_SESSION.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=0))
+
+# Retry sleeps are stretched by a random 0-50% so clients that were rate
+# limited together don't all retry in the same instant
+BACKOFF_JITTER = 0.5
+
+# Responses worth retrying (timeouts, rate limits, transient gateway errors);
+# any other non-2xx status fails immediately
+RETRYABLE_STATUSES = frozenset({408, 429, 500, 502, 503, 504})
+
+# APOLLO_CACHE_MODE values: which direction the response cache is used in
+CACHE_READ_MODES = {"readWrite", "readOnly"}
+CACHE_WRITE_MODES = {"readWrite", "writeOnly"}
+
+
+class ResponseCache:
+    """
+    Thread-safe in-memory LRU cache whose entries expire after a TTL.
+    """
+
+    def __init__(self, ttl: float = 86400, maxsize: int = 50000):
+        """
+        Initialize the cache.
+
+        Args:
+            ttl: Seconds an entry stays valid
+            maxsize: Max entries kept; least recently used are evicted first
+        """
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Return the cached value for key, or None if missing or expired.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            stored_at, value = entry
+            if time.monotonic() - stored_at > self.ttl:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any) -> None:
+        """
+        Store value under key, evicting the oldest entries past maxsize.
+        """
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self._lock:
+            self._entries.clear()
+
+
+# Raw Apollo matches keyed by the normalized request identity, shared by all
+# clients; only consulted when APOLLO_CACHE_MODE enables it
+_RESPONSE_CACHE = ResponseCache(ttl=config.APOLLO_CACHE_TTL_SECS)
+
 
 class ApolloAPIError(Exception):
     """Custom exception for Apollo API errors."""
@@ -45,12 +125,16 @@ class ApolloClient:
             )
 
         self.base_url = config.APOLLO_BASE_URL
-        self.session = requests.Session()
-        self.session.headers.update({
+        self.session = _SESSION
+        # Sent per request: the pooled session is shared across API keys
+        self.headers = {
             "Content-Type": "application/json",
             "Cache-Control": "no-cache",
             "X-Api-Key": self.api_key
-        })
+        }
+        # The response cache is process-wide; scope entries to this account
+        self._cache_scope = hashlib.blake2b(
+            self.api_key.encode(), digest_size=8).hexdigest()
 
         logger.info("Apollo API client initialized")
 
@@ -71,33 +155,49 @@ class ApolloClient:
         """
         batch_size = batch_size or config.APOLLO_BATCH_SIZE
         batch_size = min(batch_size, 10)  # Apollo allows max 10 per request
-        all_results = []
 
         logger.info(
             f"Enriching {len(records)} people in batches of {batch_size}")
 
-        for i, batch in enumerate(chunk_list(records, batch_size)):
-            logger.info(
-                f"Processing people batch {i + 1} ({len(batch)} records)")
-
-            try:
-                payload = self._prepare_people_payload(batch)
-                response = self._make_request("/people/bulk_match", payload)
-                enriched = self._parse_people_response(response, batch)
-                all_results.extend(enriched)
-
-            except Exception as e:
-                logger.error(f"People batch {i + 1} failed: {e}")
-                # Add failed records with error marker
-                for record in batch:
-                    all_results.append({
-                        **record,
-                        "_enrichment_error": str(e)
-                    })
+        all_results = self._run_batches(
+            self._enrich_people_batch, list(chunk_list(records, batch_size)))
 
         logger.info(f"People enrichment complete: {len(all_results)} records")
         return all_results
 
+    def _enrich_people_batch(self, i: int, batch: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Enrich one people batch; failures mark every record in the batch.
+
+        Args:
+            i: Batch index (0-based, for logging)
+            batch: Records in this batch
+
+        Returns:
+            Enriched records for the batch (same order)
+        """
+        logger.info(
+            f"Processing people batch {i + 1} ({len(batch)} records)")
+
+        try:
+            details = self._prepare_people_payload(batch)["details"]
+            keys = [_cache_key(self._cache_scope, "people", detail) for detail in details]
+            matches = self._cached_matches(keys)
+            misses = [j for j, match in enumerate(matches) if match is None]
+            if misses:
+                payload = {"details": [details[j] for j in misses]}
+                response = self._make_request("/people/bulk_match", payload)
+                fetched = response.get("matches", [])
+                for j, match in zip(misses, fetched):
+                    matches[j] = match
+                self._store_matches([keys[j] for j in misses], fetched)
+            return self._parse_people_response({"matches": matches}, batch)
+
+        except Exception as e:
+            logger.error(f"People batch {i + 1} failed: {e}")
+            # Add failed records with error marker
+            return [{**record, "_enrichment_error": str(e)} for record in batch]
+
     def enrich_organizations_bulk(
         self,
         records: List[Dict[str, Any]],
@@ -115,76 +215,145 @@ class ApolloClient:
         """
         batch_size = batch_size or config.APOLLO_BATCH_SIZE
         batch_size = min(batch_size, 10)  # Apollo allows max 10 per request
-        all_results = []
 
         logger.info(
             f"Enriching {len(records)} organizations in batches of {batch_size}")
 
-        for i, batch in enumerate(chunk_list(records, batch_size)):
-            logger.info(f"Processing org batch {i + 1} ({len(batch)} records)")
-
-            # Separate records with domain vs without (API requires "domains" array)
-            records_with_org_info = []
-            records_without_org_info = []
-
-            for record in batch:
-                has_domain = record.get("Website URLs") and str(
-                    record["Website URLs"]).strip()
-                has_company = record.get("Company Name (Based on Website Domain)") and str(
-                    record["Company Name (Based on Website Domain)"]).strip()
-
-                if has_domain or has_company:
-                    records_with_org_info.append(record)
-                else:
-                    records_without_org_info.append(record)
-
-            # Build domains list (API expects "domains"); only records with Website URLs can be enriched
-            records_with_domain = []
-            domains = []
-            for record in records_with_org_info:
-                if record.get("Website URLs") and str(record["Website URLs"]).strip():
-                    domain = extract_domain(
-                        str(record["Website URLs"]).strip())
-                    if domain:
-                        records_with_domain.append(record)
-                        domains.append(domain)
-            records_with_only_company = [
-                r for r in records_with_org_info if r not in records_with_domain]
-
-            # Skip API call if no domains (e.g. scraped data has only company names)
-            if not domains:
-                if records_with_org_info:
-                    logger.debug(
-                        "Batch %s: No domains (only company names); skipping org enrichment",
-                        i + 1,
-                    )
-                all_results.extend(records_with_org_info)
-                all_results.extend(records_without_org_info)
-                continue
-
-            try:
-                payload = {"domains": domains}
-                response = self._make_request(
-                    "/organizations/bulk_enrich", payload)
-                enriched = self._parse_org_response(
-                    response, records_with_domain)
-                all_results.extend(enriched)
-                all_results.extend(records_with_only_company)
-                all_results.extend(records_without_org_info)
-
-            except Exception as e:
-                logger.error(f"Organization batch {i + 1} failed: {e}")
-                # Add all records with error marker
-                for record in batch:
-                    all_results.append({
-                        **record,
-                        "_enrichment_error": str(e)
-                    })
+        all_results = self._run_batches(
+            self._enrich_org_batch, list(chunk_list(records, batch_size)))
 
         logger.info(
             f"Organization enrichment complete: {len(all_results)} records")
         return all_results
 
+    def _enrich_org_batch(self, i: int, batch: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Enrich one organization batch; failures mark every record in the batch.
+
+        Args:
+            i: Batch index (0-based, for logging)
+            batch: Records in this batch
+
+        Returns:
+            Records for the batch: enriched ones first, then records without a domain
+        """
+        logger.info(f"Processing org batch {i + 1} ({len(batch)} records)")
+
+        # Separate records with domain vs without (API requires "domains" array)
+        records_with_org_info = []
+        records_without_org_info = []
+
+        for record in batch:
+            has_domain = record.get("Website URLs") and str(
+                record["Website URLs"]).strip()
+            has_company = record.get("Company Name (Based on Website Domain)") and str(
+                record["Company Name (Based on Website Domain)"]).strip()
+
+            if has_domain or has_company:
+                records_with_org_info.append(record)
+            else:
+                records_without_org_info.append(record)
+
+        # Build domains list (API expects "domains"); only records with Website URLs can be enriched
+        records_with_domain = []
+        domains = []
+        for record in records_with_org_info:
+            if record.get("Website URLs") and str(record["Website URLs"]).strip():
+                domain = extract_domain(
+                    str(record["Website URLs"]).strip())
+                if domain:
+                    records_with_domain.append(record)
+                    domains.append(domain)
+        records_with_only_company = [
+            r for r in records_with_org_info if r not in records_with_domain]
+
+        # Skip API call if no domains (e.g. scraped data has only company names)
+        if not domains:
+            if records_with_org_info:
+                logger.debug(
+                    "Batch %s: No domains (only company names); skipping org enrichment",
+                    i + 1,
+                )
+            return records_with_org_info + records_without_org_info
+
+        try:
+            # Rows often share a company website; ask Apollo once per domain and
+            # fan each match back out to every record with that domain
+            unique_domains = list(dict.fromkeys(domains))
+            keys = [_cache_key(self._cache_scope, "org", domain) for domain in unique_domains]
+            matches = self._cached_matches(keys)
+            misses = [j for j, match in enumerate(matches) if match is None]
+            if misses:
+                payload = {"domains": [unique_domains[j] for j in misses]}
+                response = self._make_request(
+                    "/organizations/bulk_enrich", payload)
+                fetched = response.get("matches", [])
+                for j, match in zip(misses, fetched):
+                    matches[j] = match
+                self._store_matches([keys[j] for j in misses], fetched)
+            position = {d: j for j, d in enumerate(unique_domains)}
+            enriched = self._parse_org_response(
+                {"matches": [matches[position[d]] for d in domains]},
+                records_with_domain)
+            return enriched + records_with_only_company + records_without_org_info
+
+        except Exception as e:
+            logger.error(f"Organization batch {i + 1} failed: {e}")
+            # Add all records with error marker
+            return [{**record, "_enrichment_error": str(e)} for record in batch]
+
+    def _cached_matches(self, keys: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Look up cached Apollo matches for request keys.
+
+        Args:
+            keys: Cache keys, one per requested person/domain
+
+        Returns:
+            Cached match per key (None for misses or when cache reads are off)
+        """
+        if config.APOLLO_CACHE_MODE not in CACHE_READ_MODES:
+            return [None] * len(keys)
+        return [_RESPONSE_CACHE.get(key) for key in keys]
+
+    def _store_matches(self, keys: List[str], matches: List[Any]) -> None:
+        """
+        Cache non-empty Apollo matches under their request keys.
+
+        Args:
+            keys: Cache keys, aligned with matches
+            matches: Matches returned by the API
+        """
+        if config.APOLLO_CACHE_MODE not in CACHE_WRITE_MODES:
+            return
+        for key, match in zip(keys, matches):
+            if match:
+                _RESPONSE_CACHE.set(key, match)
+
+    def _run_batches(
+        self,
+        enrich_batch: Callable[[int, List[Dict[str, Any]]], List[Dict[str, Any]]],
+        batches: List[List[Dict[str, Any]]],
+    ) -> List[Dict[str, Any]]:
+        """
+        Run enrich_batch over batches, up to APOLLO_CONCURRENCY at a time.
+
+        Args:
+            enrich_batch: Per-batch worker taking (batch index, batch)
+            batches: Record batches
+
+        Returns:
+            Flattened results in batch order
+        """
+        workers = min(max(1, config.APOLLO_CONCURRENCY), len(batches))
+        if workers <= 1:
+            results = [enrich_batch(i, batch) for i, batch in enumerate(batches)]
+        else:
+            # Batches are independent and network-bound; map() keeps input order
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(enrich_batch, range(len(batches)), batches))
+        return [record for batch_results in results for record in batch_results]
+
     def _make_request(
         self,
         endpoint: str,
@@ -208,56 +377,50 @@ class ApolloClient:
         url = f"{self.base_url}{endpoint}"
         timeout = timeout or config.APOLLO_TIMEOUT
         attempt = 0
+        max_retries = config.APOLLO_MAX_RETRIES
+        # Serialized once for all attempts; headers already carry the JSON content type
+        body = json_dumps_bytes(payload)
 
-        while attempt < config.APOLLO_MAX_RETRIES:
+        while attempt < max_retries:
             try:
                 logger.debug(
                     f"API request attempt {attempt + 1} to {endpoint}")
 
                 response = self.session.post(
                     url,
-                    json=payload,
+                    data=body,
+                    headers=self.headers,
                     timeout=timeout
                 )
 
+                status = response.status_code
+
                 # Success
-                if response.status_code == 200:
-                    return response.json()
-
-                # Rate limit - retry with backoff
-                elif response.status_code == 429:
-                    backoff = self._calculate_backoff(attempt)
-                    logger.warning(
-                        f"Rate limited (429). Retrying in {backoff}s "
-                        f"(attempt {attempt + 1}/{config.APOLLO_MAX_RETRIES})"
-                    )
-                    time.sleep(backoff)
-                    attempt += 1
-                    continue
-
-                # Server error - retry
-                elif 500 <= response.status_code < 600:
-                    backoff = self._calculate_backoff(attempt)
-                    logger.warning(
-                        f"Server error ({response.status_code}). "
-                        f"Retrying in {backoff}s "
-                        f"(attempt {attempt + 1}/{config.APOLLO_MAX_RETRIES})"
-                    )
-                    time.sleep(backoff)
-                    attempt += 1
-                    continue
-
-                # Client error - don't retry
-                else:
-                    error_msg = f"API error {response.status_code}: {response.text}"
+                if 200 <= status < 300:
+                    return json_loads(response.content)
+
+                # Client error - fail fast, no backoff
+                if status not in RETRYABLE_STATUSES:
+                    error_msg = f"API error {status}: {response.text}"
                     logger.error(error_msg)
                     raise ApolloAPIError(error_msg)
 
+                # Rate limit / transient server error - retry after Retry-After or backoff
+                backoff = self._retry_delay(response, attempt)
+                reason = "Rate limited (429)" if status == 429 else f"Server error ({status})"
+                logger.warning(
+                    f"{reason}. Retrying in {backoff:.1f}s "
+                    f"(attempt {attempt + 1}/{max_retries})"
+                )
+                time.sleep(backoff)
+                attempt += 1
+                continue
+
             except requests.Timeout:
-                backoff = self._calculate_backoff(attempt)
+                backoff = self._jittered_backoff(attempt)
                 logger.warning(
-                    f"Request timeout. Retrying in {backoff}s "
-                    f"(attempt {attempt + 1}/{config.APOLLO_MAX_RETRIES})"
+                    f"Request timeout. Retrying in {backoff:.1f}s "
+                    f"(attempt {attempt + 1}/{max_retries})"
                 )
                 time.sleep(backoff)
                 attempt += 1
@@ -267,8 +430,13 @@ class ApolloClient:
                 logger.error(f"Request failed: {e}")
                 raise ApolloAPIError(f"Request failed: {e}")
 
+            except ValueError as e:
+                # Undecodable 2xx body (orjson and json decode errors are ValueErrors)
+                logger.error(f"Invalid JSON response: {e}")
+                raise ApolloAPIError(f"Invalid JSON response: {e}")
+
         raise ApolloAPIError(
-            f"Request failed after {config.APOLLO_MAX_RETRIES} attempts"
+            f"Request failed after {max_retries} attempts"
         )
 
     def _calculate_backoff(self, attempt: int) -> float:
@@ -281,8 +449,38 @@ class ApolloClient:
         Returns:
             Backoff time in seconds
         """
-        backoff = config.APOLLO_INITIAL_BACKOFF * (2 ** attempt)
-        return min(backoff, config.APOLLO_MAX_BACKOFF)
+        initial, cap = config.APOLLO_INITIAL_BACKOFF, config.APOLLO_MAX_BACKOFF
+        return min(initial * (1 << attempt), cap)
+
+    def _retry_delay(self, response: requests.Response, attempt: int) -> float:
+        """
+        Delay before retrying a retryable response: the server's Retry-After
+        (seconds, capped at APOLLO_MAX_BACKOFF) when given, else jittered backoff.
+
+        Args:
+            response: Retryable API response
+            attempt: Current attempt number (0-indexed)
+
+        Returns:
+            Delay in seconds
+        """
+        retry_after = response.headers.get("Retry-After", "").strip()
+        if retry_after.isdigit():
+            return min(float(retry_after), config.APOLLO_MAX_BACKOFF)
+        return self._jittered_backoff(attempt)
+
+    def _jittered_backoff(self, attempt: int) -> float:
+        """
+        Backoff actually slept before a retry: the exponential backoff plus up to
+        BACKOFF_JITTER of random extra time.
+
+        Args:
+            attempt: Current attempt number (0-indexed)
+
+        Returns:
+            Backoff time in seconds
+        """
+        return self._calculate_backoff(attempt) * (1 + random.uniform(0, BACKOFF_JITTER))
 
     def _prepare_people_payload(self, records: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
@@ -328,15 +526,14 @@ class ApolloClient:
             records: List of records with Website URLs (domain)
 
         Returns:
-            API payload {"domains": ["example.com", ...]}
+            API payload {"domains": ["example.com", ...]} (unique, first-seen order)
         """
-        domains = []
-        for record in records:
-            if record.get("Website URLs") and str(record["Website URLs"]).strip():
-                domain = extract_domain(str(record["Website URLs"]).strip())
-                if domain:
-                    domains.append(domain)
-        return {"domains": domains}
+        domains = (
+            extract_domain(str(record["Website URLs"]).strip())
+            for record in records
+            if record.get("Website URLs") and str(record["Website URLs"]).strip()
+        )
+        return {"domains": list(dict.fromkeys(d for d in domains if d))}
 
     def _parse_people_response(
         self,
@@ -353,27 +550,13 @@ class ApolloClient:
         Returns:
             List of enriched records
         """
-        matches = response.get("matches", [])
-        enriched_records = []
+        mapped = map_apollo_person_responses(response.get("matches", []))
 
         # Map matches back to original records by index
-        for i, record in enumerate(original_records):
-            enriched = record.copy()
-
-            if i < len(matches) and matches[i]:
-                match = matches[i]
-                person_data = map_apollo_person_response(match)
-                enriched.update(person_data)
-
-                # Also include organization data if present
-                if match.get("organization"):
-                    org_data = map_apollo_company_response(
-                        match["organization"])
-                    enriched.update(org_data)
-
-            enriched_records.append(enriched)
-
-        return enriched_records
+        return [
+            {**record, **mapped[i]} if i < len(mapped) else record.copy()
+            for i, record in enumerate(original_records)
+        ]
 
     def _parse_org_response(
         self,
@@ -405,6 +588,37 @@ class ApolloClient:
         return enriched_records
 
 
+def _cache_key(scope: str, kind: str, identity: Any) -> str:
+    """Stable hash of an account scope and person detail / domain for the response cache."""
+    raw = json.dumps([scope, kind, identity], sort_keys=True, default=str)
+    return hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+
+
+# (API field, column, formatter) for person fields copied when truthy; hoisted
+# so mapping a batch is one table walk per match instead of a branch per field
+_PERSON_BASE_FIELDS = (
+    ("first_name", "First Name", safe_str),
+    ("last_name", "Last Name", safe_str),
+    ("title", "Job Title", safe_str),
+    ("email", "Email ID (unique)", safe_str),
+    ("linkedin_url", "Person LinkedIn Profile", safe_str),
+    ("country", "Country", safe_str),
+    ("state", "State", safe_str),
+)
+_PERSON_APOLLO_FIELDS = (
+    ("email_status", "Apollo Person: Email Status", safe_str),
+    ("headline", "Apollo Person: Headline", safe_str),
+    ("seniority", "Apollo Person: Seniority", safe_str),
+    ("departments", "Apollo Person: Departments", flatten_list_to_string),
+    ("subdepartments", "Apollo Person: Subdepartments", flatten_list_to_string),
+    ("functions", "Apollo Person: Functions", flatten_list_to_string),
+    ("photo_url", "Apollo Person: Photo URL", safe_str),
+    ("twitter_url", "Apollo Person: Twitter URL", safe_str),
+    ("github_url", "Apollo Person: Github URL", safe_str),
+    ("facebook_url", "Apollo Person: Facebook URL", safe_str),
+)
+
+
 def map_apollo_person_response(person: Dict[str, Any]) -> Dict[str, Any]:
     """
     Map Apollo person API response to database columns.
@@ -415,59 +629,29 @@ def map_apollo_person_response(person: Dict[str, Any]) -> Dict[str, Any]:
     Returns:
         Dictionary with base columns + Apollo Person columns
     """
-    mapped = {}
-
-    # Base columns
-    if person.get("first_name"):
-        mapped["First Name"] = safe_str(person["first_name"])
-    if person.get("last_name"):
-        mapped["Last Name"] = safe_str(person["last_name"])
-    if person.get("title"):
-        mapped["Job Title"] = safe_str(person["title"])
-    if person.get("email"):
-        mapped["Email ID (unique)"] = safe_str(person["email"])
-    if person.get("linkedin_url"):
-        mapped["Person LinkedIn Profile"] = safe_str(person["linkedin_url"])
-    if person.get("country"):
-        mapped["Country"] = safe_str(person["country"])
-    if person.get("state"):
-        mapped["State"] = safe_str(person["state"])
-    if person.get("phone_numbers") and person["phone_numbers"]:
-        mapped["Contact Number (Person)"] = safe_str(
-            person["phone_numbers"][0])
+    get = person.get
+    mapped = {
+        column: fmt(value)
+        for field, column, fmt in _PERSON_BASE_FIELDS
+        if (value := get(field))
+    }
+    phone_numbers = get("phone_numbers")
+    if phone_numbers:
+        mapped["Contact Number (Person)"] = safe_str(phone_numbers[0])
 
     # Apollo Person columns
-    if person.get("email_status"):
-        mapped["Apollo Person: Email Status"] = safe_str(
-            person["email_status"])
-    if person.get("headline"):
-        mapped["Apollo Person: Headline"] = safe_str(person["headline"])
-    if person.get("seniority"):
-        mapped["Apollo Person: Seniority"] = safe_str(person["seniority"])
-    if person.get("departments"):
-        mapped["Apollo Person: Departments"] = flatten_list_to_string(
-            person["departments"])
-    if person.get("subdepartments"):
-        mapped["Apollo Person: Subdepartments"] = flatten_list_to_string(
-            person["subdepartments"])
-    if person.get("functions"):
-        mapped["Apollo Person: Functions"] = flatten_list_to_string(
-            person["functions"])
-    if person.get("photo_url"):
-        mapped["Apollo Person: Photo URL"] = safe_str(person["photo_url"])
-    if person.get("twitter_url"):
-        mapped["Apollo Person: Twitter URL"] = safe_str(person["twitter_url"])
-    if person.get("github_url"):
-        mapped["Apollo Person: Github URL"] = safe_str(person["github_url"])
-    if person.get("facebook_url"):
-        mapped["Apollo Person: Facebook URL"] = safe_str(
-            person["facebook_url"])
-    if person.get("is_likely_to_engage") is not None:
-        mapped["Apollo Person: Is Likely To Engage"] = "Yes" if person["is_likely_to_engage"] else "No"
+    for field, column, fmt in _PERSON_APOLLO_FIELDS:
+        value = get(field)
+        if value:
+            mapped[column] = fmt(value)
+    likely_to_engage = get("is_likely_to_engage")
+    if likely_to_engage is not None:
+        mapped["Apollo Person: Is Likely To Engage"] = "Yes" if likely_to_engage else "No"
 
     # Current employment info
-    if person.get("employment_history") and person["employment_history"]:
-        current = person["employment_history"][0]
+    employment_history = get("employment_history")
+    if employment_history:
+        current = employment_history[0]
         if current.get("organization_name"):
             mapped["Apollo Person: Current Org"] = safe_str(
                 current["organization_name"])
@@ -478,6 +662,32 @@ def map_apollo_person_response(person: Dict[str, Any]) -> Dict[str, Any]:
     return mapped
 
 
+def map_apollo_person_responses(
+    matches: List[Optional[Dict[str, Any]]]
+) -> List[Dict[str, Any]]:
+    """
+    Map every match of a people bulk_match response to database columns.
+
+    Organization data nested in a match is merged in as Apollo Company columns.
+
+    Args:
+        matches: Person matches from API (None/empty for unmatched details)
+
+    Returns:
+        Mapped columns per match ({} for unmatched), same order as matches
+    """
+    mapped_matches = []
+    for match in matches:
+        if not match:
+            mapped_matches.append({})
+            continue
+        mapped = map_apollo_person_response(match)
+        if match.get("organization"):
+            mapped.update(map_apollo_company_response(match["organization"]))
+        mapped_matches.append(mapped)
+    return mapped_matches
+
+
 def map_apollo_company_response(org: Dict[str, Any]) -> Dict[str, Any]:
     """
     Map Apollo organization API response to database columns.
@@ -38,11 +38,20 @@ class Config:
     APOLLO_INITIAL_BACKOFF: float = float(
         os.getenv("APOLLO_INITIAL_BACKOFF", "1.0"))
     APOLLO_MAX_BACKOFF: float = float(os.getenv("APOLLO_MAX_BACKOFF", "60.0"))
+    # Max people/org batches in flight at once (1 = sequential; raise it only
+    # on plans whose rate limit allows parallel requests)
+    APOLLO_CONCURRENCY: int = int(os.getenv("APOLLO_CONCURRENCY", "1"))
+    # In-process cache of Apollo matches: off, readWrite, readOnly or writeOnly
+    APOLLO_CACHE_MODE: str = os.getenv("APOLLO_CACHE_MODE", "off")
+    APOLLO_CACHE_TTL_SECS: int = int(os.getenv("APOLLO_CACHE_TTL_SECS", "86400"))
 
     # Processing Configuration
     MAX_FILE_SIZE_MB: int = int(os.getenv("MAX_FILE_SIZE_MB", "50"))
     MAX_ROWS: int = int(os.getenv("MAX_ROWS", "0"))  # 0 = no limit
     EXCEL_CHUNK_SIZE: int = int(os.getenv("EXCEL_CHUNK_SIZE", "1000"))
+    # Parquet snapshots of normalized/enriched uploads keyed by file hash, so
+    # retries skip parsing and enrichment (empty = disabled)
+    CACHE_DIR: str = os.getenv("CACHE_DIR", "")
     ENABLE_PEOPLE_ENRICHMENT: bool = os.getenv(
         "ENABLE_PEOPLE_ENRICHMENT", "true").lower() == "true"
     ENABLE_COMPANY_ENRICHMENT: bool = os.getenv(
@@ -89,6 +98,16 @@ class Config:
     OPENAI_EXTRACTION_MODEL: str = os.getenv(
         "OPENAI_EXTRACTION_MODEL", "gpt-4o-mini"
     )
+    # Optional cheaper model tried first on small, table-free pages; the main
+    # model is only used when it finds nothing (empty = always use main model)
+    OPENAI_EXTRACTION_MODEL_CHEAP: str = os.getenv("OPENAI_EXTRACTION_MODEL_CHEAP", "")
+    # SQLite file caching LLM extraction results by model + page content
+    # (empty = disabled); unchanged pages skip the OpenAI call on re-runs
+    LLM_CACHE_PATH: str = os.getenv("LLM_CACHE_PATH", "")
+    # How long a cached LLM extraction result stays valid (default 7 days)
+    LLM_CACHE_TTL_SECS: int = int(os.getenv("LLM_CACHE_TTL_SECS", "604800"))
+    # Client-side cap on sync OpenAI extraction calls per minute (0 = no cap)
+    OPENAI_MAX_RPM: int = int(os.getenv("OPENAI_MAX_RPM", "0"))
 
     def validate(self) -> None:
         """
@@ -174,6 +193,9 @@ BASE_COLUMNS = [
     "Email Send (Yes/No)"
 ]
 
+# Prefixes of the Apollo enrichment columns added to the Truth table at runtime
+APOLLO_COLUMN_PREFIXES = ("Apollo Person:", "Apollo Company:")
+
 # Column mappings for flexible Excel parsing (case-insensitive)
 COLUMN_MAPPINGS = {
     "Email ID (unique)": [
@@ -228,3 +250,10 @@ COLUMN_MAPPINGS = {
         "industry", "sector", "vertical", "industry_name"
     ]
 }
+
+# Lowercased alias (or standard name) -> standard column, built once at import
+ALIAS_TO_STANDARD = {
+    alias.lower(): standard_col
+    for standard_col, aliases in COLUMN_MAPPINGS.items()
+    for alias in (*aliases, standard_col)
+}
@@ -8,10 +8,11 @@ import math
 import sqlite3
 import logging
 from contextlib import contextmanager
+from functools import lru_cache
 from typing import Dict, List, Any, Optional, Tuple
 import pandas as pd
 
-from config import BASE_COLUMNS, config
+from config import APOLLO_COLUMN_PREFIXES, BASE_COLUMNS, config
 from utils import get_utc_timestamp, setup_logging
 
 logger = setup_logging(config.LOG_LEVEL, config.LOG_FILE,
@@ -20,6 +21,19 @@ logger = setup_logging(config.LOG_LEVEL, config.LOG_FILE,
 # Column that must never be overwritten on update (always keep existing value).
 EMAIL_SEND_COLUMN = "Email Send (Yes/No)"
 
+# Rows fetched per chunk when exporting the Truth table to a DataFrame.
+EXPORT_CHUNK_ROWS = 10_000
+
+# Emails bound per "IN (...)" lookup; stays under SQLite's default 999-parameter limit.
+EMAIL_LOOKUP_CHUNK = 500
+
+# Leading marker on a search value that asks for a prefix match instead of a
+# substring match; on SQLite this lets the NOCASE email/company indexes be used.
+PREFIX_SEARCH_MARKER = "^"
+
+# Statements sent per round trip by psycopg2 batch writes (execute_batch page size).
+PG_WRITE_PAGE_ROWS = 1000
+
 
 def _quote_identifier(name: str) -> str:
     """Quote a SQL identifier and escape any double quotes inside it (SQLite and Postgres)."""
@@ -42,6 +56,85 @@ def _has_value(val: Any) -> bool:
     return not _is_empty(val)
 
 
+@lru_cache(maxsize=256)
+def _insert_sql(table: str, columns: Tuple[str, ...], placeholder: str, suffix: str = "") -> str:
+    """INSERT statement text for a column tuple, built once per shape and reused."""
+    column_names = ", ".join(_quote_identifier(col) for col in columns)
+    placeholders = ", ".join([placeholder] * len(columns))
+    return f"INSERT INTO {table} ({column_names}) VALUES ({placeholders}){suffix}"
+
+
+@lru_cache(maxsize=256)
+def _update_sql(table: str, columns: Tuple[str, ...], placeholder: str) -> str:
+    """UPDATE-by-S.N. statement text for a column tuple, built once per shape and reused."""
+    set_clause = ", ".join(f"{_quote_identifier(col)} = {placeholder}" for col in columns)
+    return f'UPDATE {table} SET {set_clause} WHERE {_quote_identifier("S.N.")} = {placeholder}'
+
+
+def _like_pattern(value: Any, allow_prefix: bool) -> str:
+    """LIKE pattern: substring match, or prefix match for "^value" when allow_prefix."""
+    text = str(value)
+    if text.startswith(PREFIX_SEARCH_MARKER):
+        text = text[len(PREFIX_SEARCH_MARKER):]
+        if allow_prefix:
+            return f"{text}%"
+    return f"%{text}%"
+
+
+def _filter_clause(
+    filters: Optional[Dict[str, Any]], placeholder: str, allow_prefix: bool = False
+) -> Tuple[str, List[Any]]:
+    """WHERE clause (or "") and params for search filters, using the driver's placeholder."""
+    where_clauses = []
+    params: List[Any] = []
+    if filters:
+        for col, value in filters.items():
+            if value:
+                where_clauses.append(f"{_quote_identifier(col)} LIKE {placeholder}")
+                params.append(_like_pattern(value, allow_prefix))
+    where_sql = f"WHERE {' AND '.join(where_clauses)}" if where_clauses else ""
+    return where_sql, params
+
+
+def _merge_record(existing: Dict[str, Any], record: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Fill empty fields of existing from record (never S.N. / Email Send); None if nothing new."""
+    merged = dict(existing)
+    fields_filled = 0
+    timestamp_key = "UPDATE AS ON"
+    for key, incoming_val in record.items():
+        if key == "S.N." or key == EMAIL_SEND_COLUMN:
+            continue
+        if key not in merged:
+            merged[key] = incoming_val
+            if _has_value(incoming_val):
+                fields_filled += 1
+        else:
+            if _is_empty(merged[key]) and _has_value(incoming_val):
+                merged[key] = incoming_val
+                if key != timestamp_key:
+                    fields_filled += 1
+    return merged if fields_filled else None
+
+
+def _apollo_columns(records: List[Dict[str, Any]]) -> List[str]:
+    """Apollo Person/Company columns used by any of records, in first-seen order."""
+    return list(dict.fromkeys(
+        col for record in records for col in record
+        if col.startswith(APOLLO_COLUMN_PREFIXES)
+    ))
+
+
+def _group_by_columns(
+    records: List[Dict[str, Any]],
+) -> Dict[Tuple[str, ...], List[Dict[str, Any]]]:
+    """Group records by their column tuple (minus S.N.) so each group shares one statement."""
+    groups: Dict[Tuple[str, ...], List[Dict[str, Any]]] = {}
+    for record in records:
+        columns = tuple(col for col in record if col != "S.N.")
+        groups.setdefault(columns, []).append(record)
+    return groups
+
+
 # ---------------------------------------------------------------------------
 # SQLite backend
 # ---------------------------------------------------------------------------
@@ -54,7 +147,15 @@ class _SQLiteBackend:
         self.db_path = db_path
         self.conn = sqlite3.connect(db_path, check_same_thread=False)
         self.conn.row_factory = sqlite3.Row
+        # WAL lets searches/exports read while an upload is writing
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        # Keep temp b-trees in RAM and allow a ~20 MB page cache for large uploads
+        self.conn.execute("PRAGMA temp_store=MEMORY")
+        self.conn.execute("PRAGMA cache_size=-20000")
         self.column_cache: set = set()
+        # Ordered copy of the table's columns; kept in step with ALTER TABLE
+        self._column_list: List[str] = []
         self.initialize_schema()
         self._load_column_cache()
         logger.info(f"Database initialized at {db_path}")
@@ -87,10 +188,13 @@ class _SQLiteBackend:
         create_table_sql = f"CREATE TABLE IF NOT EXISTS Truth ({', '.join(column_definitions)})"
         with self.get_cursor() as cursor:
             cursor.execute(create_table_sql)
+            # NOCASE indexes let case-insensitive "^" prefix searches use the index
+            cursor.execute('DROP INDEX IF EXISTS idx_email')
+            cursor.execute('DROP INDEX IF EXISTS idx_company')
             cursor.execute(
-                'CREATE INDEX IF NOT EXISTS idx_email ON Truth("Email ID (unique)")')
+                'CREATE INDEX IF NOT EXISTS idx_email_nocase ON Truth("Email ID (unique)" COLLATE NOCASE)')
             cursor.execute(
-                'CREATE INDEX IF NOT EXISTS idx_company ON Truth("Company Name (Based on Website Domain)")')
+                'CREATE INDEX IF NOT EXISTS idx_company_nocase ON Truth("Company Name (Based on Website Domain)" COLLATE NOCASE)')
             cursor.execute(
                 'CREATE INDEX IF NOT EXISTS idx_updated ON Truth("UPDATE AS ON")')
         logger.info("Database schema initialized with base columns")
@@ -98,7 +202,8 @@ class _SQLiteBackend:
     def _load_column_cache(self) -> None:
         with self.get_cursor() as cursor:
             cursor.execute("PRAGMA table_info(Truth)")
-            self.column_cache = {row[1] for row in cursor.fetchall()}
+            self._column_list = [row[1] for row in cursor.fetchall()]
+            self.column_cache = set(self._column_list)
         logger.debug(f"Loaded {len(self.column_cache)} columns into cache")
 
     def ensure_apollo_columns(self, column_names: List[str]) -> None:
@@ -112,10 +217,14 @@ class _SQLiteBackend:
                         cursor.execute(
                             f'ALTER TABLE Truth ADD COLUMN {_quote_identifier(col)} TEXT')
                         self.column_cache.add(col)
+                        self._column_list.append(col)
                         logger.debug(f"Added column: {col}")
                     except sqlite3.OperationalError as e:
                         if "duplicate column" not in str(e).lower():
                             raise
+                        # Added concurrently by another connection
+                        self.column_cache.add(col)
+                        self._column_list.append(col)
 
     def get_existing_record(self, email: str) -> Optional[Dict[str, Any]]:
         with self.get_cursor() as cursor:
@@ -128,19 +237,60 @@ class _SQLiteBackend:
                 return dict(row)
         return None
 
+    def _rows_by_email(self, cursor: Any, select_sql: str, emails: List[str]) -> List[Any]:
+        rows: List[Any] = []
+        for start in range(0, len(emails), EMAIL_LOOKUP_CHUNK):
+            chunk = emails[start:start + EMAIL_LOOKUP_CHUNK]
+            placeholders = ", ".join("?" * len(chunk))
+            cursor.execute(
+                f'SELECT {select_sql} FROM Truth WHERE {_quote_identifier("Email ID (unique)")} IN ({placeholders})',
+                chunk,
+            )
+            rows.extend(cursor.fetchall())
+        return rows
+
+    def _fetch_existing_many(self, emails: List[str]) -> Dict[str, Dict[str, Any]]:
+        with self.get_cursor() as cursor:
+            rows = self._rows_by_email(cursor, "*", list(dict.fromkeys(emails)))
+        return {row["Email ID (unique)"]: dict(row) for row in rows}
+
+    def _write_batch(
+        self,
+        inserts: List[Dict[str, Any]],
+        updates: List[Dict[str, Any]],
+    ) -> Dict[str, int]:
+        apollo_columns = _apollo_columns(inserts + updates)
+        if apollo_columns:
+            self.ensure_apollo_columns(apollo_columns)
+        sn_column = _quote_identifier("S.N.")
+        email_column = _quote_identifier("Email ID (unique)")
+        with self.get_cursor() as cursor:
+            for columns, group in _group_by_columns(inserts).items():
+                cursor.executemany(
+                    _insert_sql("Truth", columns, "?"),
+                    [[record[col] for col in columns] for record in group],
+                )
+            for columns, group in _group_by_columns(updates).items():
+                cursor.executemany(
+                    _update_sql("Truth", columns, "?"),
+                    [[record[col] for col in columns] + [record["S.N."]] for record in group],
+                )
+            rows = self._rows_by_email(
+                cursor, f"{sn_column}, {email_column}",
+                [record["Email ID (unique)"] for record in inserts],
+            )
+        return {row[1]: row[0] for row in rows}
+
     def _insert_record(self, record: Dict[str, Any]) -> int:
         record_copy = record.copy()
         record_copy.pop("S.N.", None)
         apollo_columns = [
             col for col in record_copy.keys()
-            if col.startswith(("Apollo Person:", "Apollo Company:"))
+            if col.startswith(APOLLO_COLUMN_PREFIXES)
         ]
         if apollo_columns:
             self.ensure_apollo_columns(apollo_columns)
-        columns = list(record_copy.keys())
-        placeholders = ", ".join(["?" for _ in columns])
-        column_names = ", ".join(_quote_identifier(col) for col in columns)
-        sql = f"INSERT INTO Truth ({column_names}) VALUES ({placeholders})"
+        sql = _insert_sql("Truth", tuple(record_copy), "?")
         with self.get_cursor() as cursor:
             cursor.execute(sql, list(record_copy.values()))
             sn = cursor.lastrowid
@@ -151,15 +301,13 @@ class _SQLiteBackend:
         sn = record["S.N."]
         apollo_columns = [
             col for col in record.keys()
-            if col.startswith(("Apollo Person:", "Apollo Company:"))
+            if col.startswith(APOLLO_COLUMN_PREFIXES)
         ]
         if apollo_columns:
             self.ensure_apollo_columns(apollo_columns)
-        update_cols = [col for col in record.keys() if col != "S.N."]
-        set_clause = ", ".join(
-            f"{_quote_identifier(col)} = ?" for col in update_cols)
+        update_cols = tuple(col for col in record.keys() if col != "S.N.")
         values = [record[col] for col in update_cols]
-        sql = f'UPDATE Truth SET {set_clause} WHERE {_quote_identifier("S.N.")} = ?'
+        sql = _update_sql("Truth", update_cols, "?")
         values.append(sn)
         with self.get_cursor() as cursor:
             cursor.execute(sql, values)
@@ -172,14 +320,7 @@ class _SQLiteBackend:
         limit: int = 50,
         offset: int = 0,
     ) -> Tuple[List[Dict[str, Any]], int]:
-        where_clauses = []
-        params = []
-        if filters:
-            for col, value in filters.items():
-                if value:
-                    where_clauses.append(f"{_quote_identifier(col)} LIKE ?")
-                    params.append(f"%{value}%")
-        where_sql = f"WHERE {' AND '.join(where_clauses)}" if where_clauses else ""
+        where_sql, params = _filter_clause(filters, "?", allow_prefix=True)
         count_sql = f"SELECT COUNT(*) FROM Truth {where_sql}"
         with self.get_cursor() as cursor:
             cursor.execute(count_sql, params)
@@ -194,10 +335,18 @@ class _SQLiteBackend:
             f"Search returned {len(records)} records (total: {total_count}, offset: {offset})")
         return records, total_count
 
+    def export_to_dataframe(self, filters: Optional[Dict[str, Any]] = None) -> pd.DataFrame:
+        where_sql, params = _filter_clause(filters, "?", allow_prefix=True)
+        query_sql = f"SELECT * FROM Truth {where_sql} ORDER BY {_quote_identifier('S.N.')} ASC"
+        # Chunked reads build columns straight from the cursor, without a dict per row
+        chunks = list(pd.read_sql_query(
+            query_sql, self.conn, params=params, chunksize=EXPORT_CHUNK_ROWS))
+        if not chunks:
+            return pd.DataFrame(columns=self.get_column_list())
+        return pd.concat(chunks, ignore_index=True)
+
     def get_column_list(self) -> List[str]:
-        with self.get_cursor() as cursor:
-            cursor.execute("PRAGMA table_info(Truth)")
-            return [row[1] for row in cursor.fetchall()]
+        return list(self._column_list)
 
     def get_statistics(self) -> Dict[str, Any]:
         with self.get_cursor() as cursor:
@@ -282,6 +431,8 @@ class _PostgresBackend:
             )
             raise ImportError("".join(parts))
         self.column_cache: set = set()
+        # Ordered copy of the table's columns; kept in step with ALTER TABLE
+        self._column_list: List[str] = []
         self.initialize_schema()
         self._load_column_cache()
         logger.info("Database initialized (PostgreSQL)")
@@ -337,8 +488,8 @@ class _PostgresBackend:
                 "SELECT column_name FROM information_schema.columns "
                 "WHERE table_schema = 'public' AND table_name = 'Truth' ORDER BY ordinal_position"
             )
-            self.column_cache = {row["column_name"]
-                                 for row in cursor.fetchall()}
+            self._column_list = [row["column_name"] for row in cursor.fetchall()]
+            self.column_cache = set(self._column_list)
         logger.debug(f"Loaded {len(self.column_cache)} columns into cache")
 
     def ensure_apollo_columns(self, column_names: List[str]) -> None:
@@ -352,10 +503,14 @@ class _PostgresBackend:
                         cursor.execute(
                             f'ALTER TABLE "Truth" ADD COLUMN {_quote_identifier(col)} TEXT')
                         self.column_cache.add(col)
+                        self._column_list.append(col)
                         logger.debug(f"Added column: {col}")
                     except Exception as e:
                         if getattr(e, "pgcode", None) != "42701" and "already exists" not in str(e).lower():
                             raise
+                        # Added concurrently by another connection
+                        self.column_cache.add(col)
+                        self._column_list.append(col)
 
     def get_existing_record(self, email: str) -> Optional[Dict[str, Any]]:
         with self.get_cursor() as cursor:
@@ -368,19 +523,71 @@ class _PostgresBackend:
                 return dict(row)
         return None
 
+    def _rows_by_email(self, cursor: Any, select_sql: str, emails: List[str]) -> List[Any]:
+        rows: List[Any] = []
+        for start in range(0, len(emails), EMAIL_LOOKUP_CHUNK):
+            chunk = emails[start:start + EMAIL_LOOKUP_CHUNK]
+            placeholders = ", ".join(["%s"] * len(chunk))
+            cursor.execute(
+                f'SELECT {select_sql} FROM "Truth" WHERE {_quote_identifier("Email ID (unique)")} IN ({placeholders})',
+                chunk,
+            )
+            rows.extend(cursor.fetchall())
+        return rows
+
+    def _fetch_existing_many(self, emails: List[str]) -> Dict[str, Dict[str, Any]]:
+        with self.get_cursor() as cursor:
+            rows = self._rows_by_email(cursor, "*", list(dict.fromkeys(emails)))
+        return {row["Email ID (unique)"]: dict(row) for row in rows}
+
+    def _write_batch(
+        self,
+        inserts: List[Dict[str, Any]],
+        updates: List[Dict[str, Any]],
+    ) -> Dict[str, int]:
+        apollo_columns = _apollo_columns(inserts + updates)
+        if apollo_columns:
+            self.ensure_apollo_columns(apollo_columns)
+        sn_column = _quote_identifier("S.N.")
+        email_column = _quote_identifier("Email ID (unique)")
+        with self.get_cursor() as cursor:
+            for columns, group in _group_by_columns(inserts).items():
+                self._executemany(
+                    cursor,
+                    _insert_sql('"Truth"', columns, "%s"),
+                    [[record[col] for col in columns] for record in group],
+                )
+            for columns, group in _group_by_columns(updates).items():
+                self._executemany(
+                    cursor,
+                    _update_sql('"Truth"', columns, "%s"),
+                    [[record[col] for col in columns] + [record["S.N."]] for record in group],
+                )
+            rows = self._rows_by_email(
+                cursor, f"{sn_column}, {email_column}",
+                [record["Email ID (unique)"] for record in inserts],
+            )
+        return {row["Email ID (unique)"]: row["S.N."] for row in rows}
+
+    def _executemany(self, cursor, sql: str, rows: List[List[Any]]) -> None:
+        """Run sql for every row; psycopg2 sends pages of statements per round trip."""
+        if self._pg3:
+            # psycopg 3 pipelines executemany itself
+            cursor.executemany(sql, rows)
+        else:
+            # psycopg2's executemany is one round trip per row
+            pg_extras.execute_batch(cursor, sql, rows, page_size=PG_WRITE_PAGE_ROWS)
+
     def _insert_record(self, record: Dict[str, Any]) -> int:
         record_copy = record.copy()
         record_copy.pop("S.N.", None)
         apollo_columns = [
             col for col in record_copy.keys()
-            if col.startswith(("Apollo Person:", "Apollo Company:"))
+            if col.startswith(APOLLO_COLUMN_PREFIXES)
         ]
         if apollo_columns:
             self.ensure_apollo_columns(apollo_columns)
-        columns = list(record_copy.keys())
-        placeholders = ", ".join(["%s"] * len(columns))
-        column_names = ", ".join(_quote_identifier(col) for col in columns)
-        sql = f'INSERT INTO "Truth" ({column_names}) VALUES ({placeholders}) RETURNING "S.N."'
+        sql = _insert_sql('"Truth"', tuple(record_copy), "%s", ' RETURNING "S.N."')
         with self.get_cursor() as cursor:
             cursor.execute(sql, list(record_copy.values()))
             row = cursor.fetchone()
@@ -392,15 +599,13 @@ class _PostgresBackend:
         sn = record["S.N."]
         apollo_columns = [
             col for col in record.keys()
-            if col.startswith(("Apollo Person:", "Apollo Company:"))
+            if col.startswith(APOLLO_COLUMN_PREFIXES)
         ]
         if apollo_columns:
             self.ensure_apollo_columns(apollo_columns)
-        update_cols = [col for col in record.keys() if col != "S.N."]
-        set_clause = ", ".join(
-            f"{_quote_identifier(col)} = %s" for col in update_cols)
+        update_cols = tuple(col for col in record.keys() if col != "S.N.")
         values = [record[col] for col in update_cols]
-        sql = f'UPDATE "Truth" SET {set_clause} WHERE {_quote_identifier("S.N.")} = %s'
+        sql = _update_sql('"Truth"', update_cols, "%s")
         values.append(sn)
         with self.get_cursor() as cursor:
             cursor.execute(sql, values)
@@ -413,14 +618,7 @@ class _PostgresBackend:
         limit: int = 50,
         offset: int = 0,
     ) -> Tuple[List[Dict[str, Any]], int]:
-        where_clauses = []
-        params: List[Any] = []
-        if filters:
-            for col, value in filters.items():
-                if value:
-                    where_clauses.append(f"{_quote_identifier(col)} LIKE %s")
-                    params.append(f"%{value}%")
-        where_sql = f"WHERE {' AND '.join(where_clauses)}" if where_clauses else ""
+        where_sql, params = _filter_clause(filters, "%s")
         count_sql = f'SELECT COUNT(*) FROM "Truth" {where_sql}'
         with self.get_cursor() as cursor:
             cursor.execute(count_sql, params)
@@ -435,13 +633,13 @@ class _PostgresBackend:
             f"Search returned {len(records)} records (total: {total_count}, offset: {offset})")
         return records, total_count
 
+    def export_to_dataframe(self, filters: Optional[Dict[str, Any]] = None) -> pd.DataFrame:
+        # pandas only supports sqlite3 among raw DBAPI connections, so build from rows
+        records, _ = self.search_records(filters, limit=1000000, offset=0)
+        return pd.DataFrame(records)
+
     def get_column_list(self) -> List[str]:
-        with self.get_cursor() as cursor:
-            cursor.execute(
-                "SELECT column_name FROM information_schema.columns "
-                "WHERE table_schema = 'public' AND table_name = 'Truth' ORDER BY ordinal_position"
-            )
-            return [row["column_name"] for row in cursor.fetchall()]
+        return list(self._column_list)
 
     def get_statistics(self) -> Dict[str, Any]:
         with self.get_cursor() as cursor:
@@ -518,36 +716,25 @@ class DatabaseManager:
     def get_existing_record(self, email: str) -> Optional[Dict[str, Any]]:
         return self._backend.get_existing_record(email)
 
-    def upsert_record(self, record: Dict[str, Any]) -> Tuple[int, str]:
+    def upsert_record(
+        self, record: Dict[str, Any], timestamp: Optional[str] = None
+    ) -> Tuple[int, str]:
         email = record.get("Email ID (unique)")
         if not email:
             raise ValueError("Email ID (unique) is required for upsert")
         existing = self.get_existing_record(email)
+        timestamp = timestamp or get_utc_timestamp()
         if not existing:
             record = dict(record)
-            record["UPDATE AS ON"] = get_utc_timestamp()
+            record["UPDATE AS ON"] = timestamp
             if EMAIL_SEND_COLUMN not in record:
                 record[EMAIL_SEND_COLUMN] = "No"
             sn = self._backend._insert_record(record)
             return (sn, "insert")
-        merged = dict(existing)
-        fields_filled = 0
-        timestamp_key = "UPDATE AS ON"
-        for key, incoming_val in record.items():
-            if key == "S.N." or key == EMAIL_SEND_COLUMN:
-                continue
-            if key not in merged:
-                merged[key] = incoming_val
-                if _has_value(incoming_val):
-                    fields_filled += 1
-            else:
-                if _is_empty(merged[key]) and _has_value(incoming_val):
-                    merged[key] = incoming_val
-                    if key != timestamp_key:
-                        fields_filled += 1
-        if fields_filled == 0:
+        merged = _merge_record(existing, record)
+        if merged is None:
             return (existing["S.N."], "skip")
-        merged["UPDATE AS ON"] = get_utc_timestamp()
+        merged["UPDATE AS ON"] = timestamp
         merged["S.N."] = existing["S.N."]
         self._backend._update_record(merged)
         return (existing["S.N."], "update")
@@ -558,21 +745,99 @@ class DatabaseManager:
     def _update_record(self, record: Dict[str, Any]) -> int:
         return self._backend._update_record(record)
 
-    def upsert_batch(self, records: List[Dict[str, Any]]) -> Tuple[List[int], Dict[str, Any]]:
-        stats: Dict[str, Any] = {
-            "inserted": 0,
-            "updated": 0,
-            "failed": 0,
-            "inserted_emails": [],
-            "updated_emails": [],
-            "failed_records": [],
-        }
-        sns = []
+    def upsert_batch(
+        self,
+        records: List[Dict[str, Any]],
+        timestamp: Optional[str] = None,
+    ) -> Tuple[List[int], Dict[str, Any]]:
+        """
+        Upsert records with one lookup query and batched INSERT/UPDATE statements.
+
+        Records are classified in Python against the existing rows (same merge
+        rules as upsert_record); repeated emails in the batch merge into the
+        first occurrence. If the batched write fails, falls back to upserting
+        record by record so a bad row only fails itself.
+
+        Args:
+            records: Records keyed by Truth column name
+            timestamp: "UPDATE AS ON" value for every written row (defaults to now)
+
+        Returns:
+            (S.N. per record, -1 for failures; stats dict)
+        """
         logger.info(f"Starting batch upsert of {len(records)} records")
+        emails = [record.get("Email ID (unique)") or "" for record in records]
+        timestamp = timestamp or get_utc_timestamp()
+        try:
+            existing = self._backend._fetch_existing_many([e for e in emails if e])
+            pending_inserts: Dict[str, Dict[str, Any]] = {}
+            pending_updates: Dict[str, Dict[str, Any]] = {}
+            actions = []
+            for record, email in zip(records, emails):
+                if not email:
+                    actions.append("fail")
+                    continue
+                current = (
+                    pending_inserts.get(email)
+                    or pending_updates.get(email)
+                    or existing.get(email)
+                )
+                if current is None:
+                    row = dict(record)
+                    row.pop("S.N.", None)
+                    row["UPDATE AS ON"] = timestamp
+                    row.setdefault(EMAIL_SEND_COLUMN, "No")
+                    pending_inserts[email] = row
+                    actions.append("insert")
+                    continue
+                merged = _merge_record(current, record)
+                if merged is None:
+                    actions.append("skip")
+                    continue
+                merged["UPDATE AS ON"] = timestamp
+                if email in pending_inserts:
+                    pending_inserts[email] = merged
+                else:
+                    pending_updates[email] = merged
+                actions.append("update")
+            inserted_sns = self._backend._write_batch(
+                list(pending_inserts.values()), list(pending_updates.values()))
+        except Exception as e:
+            logger.warning(f"Batched upsert failed ({e}); retrying record by record")
+            return self._upsert_batch_per_record(records, timestamp)
+
+        stats = self._new_batch_stats()
+        sns = []
+        for i, (email, action) in enumerate(zip(emails, actions)):
+            if action == "fail":
+                logger.error(f"Failed to upsert record {i}: Email ID (unique) is required for upsert")
+                stats["failed"] += 1
+                stats["failed_records"].append(
+                    {"email": email, "error": "Email ID (unique) is required for upsert"})
+                sns.append(-1)
+                continue
+            sns.append(inserted_sns[email] if email in inserted_sns else existing[email]["S.N."])
+            if action == "insert":
+                stats["inserted"] += 1
+                stats["inserted_emails"].append(email)
+            elif action == "update":
+                stats["updated"] += 1
+                stats["updated_emails"].append(email)
+        logger.info(
+            f"Batch upsert complete: {stats['inserted']} inserted, "
+            f"{stats['updated']} updated, {stats['failed']} failed"
+        )
+        return sns, stats
+
+    def _upsert_batch_per_record(
+        self, records: List[Dict[str, Any]], timestamp: Optional[str] = None
+    ) -> Tuple[List[int], Dict[str, Any]]:
+        stats = self._new_batch_stats()
+        sns = []
         for i, record in enumerate(records):
             email = record.get("Email ID (unique)") or ""
             try:
-                sn, action = self.upsert_record(record)
+                sn, action = self.upsert_record(record, timestamp)
                 sns.append(sn)
                 if action == "insert":
                     stats["inserted"] += 1
@@ -594,20 +859,45 @@ class DatabaseManager:
         )
         return sns, stats
 
+    @staticmethod
+    def _new_batch_stats() -> Dict[str, Any]:
+        return {
+            "inserted": 0,
+            "updated": 0,
+            "failed": 0,
+            "inserted_emails": [],
+            "updated_emails": [],
+            "failed_records": [],
+        }
+
     def search_records(
         self,
         filters: Optional[Dict[str, Any]] = None,
         limit: int = 50,
         offset: int = 0,
     ) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Search records page by page.
+
+        Filter values match anywhere in the column. On SQLite, a value
+        starting with "^" matches as a prefix instead, which can use the
+        NOCASE email/company indexes; Postgres ignores the marker.
+
+        Args:
+            filters: Column name -> search value (empty values ignored)
+            limit: Page size
+            offset: Rows to skip
+
+        Returns:
+            (records on this page, total matching count)
+        """
         return self._backend.search_records(filters=filters, limit=limit, offset=offset)
 
     def export_to_dataframe(
         self,
         filters: Optional[Dict[str, Any]] = None,
     ) -> pd.DataFrame:
-        records, _ = self.search_records(filters, limit=1000000, offset=0)
-        df = pd.DataFrame(records)
+        df = self._backend.export_to_dataframe(filters)
         logger.info(f"Exported {len(df)} records to DataFrame")
         return df
 
@@ -12,9 +12,11 @@ import {
 } from "@/lib/api";
 
 const PAGE_SIZES = [25, 50, 100, 500];
-const FILTER_KEYS: { key: keyof FilterParams; label: string }[] = [
-  { key: "email", label: "Email" },
-  { key: "company", label: "Company" },
+// prefix: a leading "^" matches from the start of the value, which is indexed
+// on SQLite for these columns. All filters match anywhere by default.
+const FILTER_KEYS: { key: keyof FilterParams; label: string; prefix?: boolean }[] = [
+  { key: "email", label: "Email", prefix: true },
+  { key: "company", label: "Company", prefix: true },
   { key: "country", label: "Country" },
   { key: "first_name", label: "First name" },
   { key: "last_name", label: "Last name" },
@@ -169,7 +171,7 @@ export default function DatabasePage() {
       <section className="rounded-lg border border-gray-200 bg-white p-4">
         <h3 className="mb-3 text-sm font-medium text-gray-700">Search & filter</h3>
         <div className="grid grid-cols-2 gap-4 sm:grid-cols-3 md:grid-cols-4">
-          {FILTER_KEYS.map(({ key, label }) => (
+          {FILTER_KEYS.map(({ key, label, prefix }) => (
             <div key={key}>
               <label htmlFor={`filter-${key}`} className="block text-xs text-gray-500">
                 {label}
@@ -179,7 +181,11 @@ export default function DatabasePage() {
                 type="text"
                 value={(filters[key] as string) ?? ""}
                 onChange={(e) => handleFilterChange(key, e.target.value)}
-                placeholder={`Search by ${label.toLowerCase()}…`}
+                placeholder={
+                  prefix
+                    ? `Search by ${label.toLowerCase()}… (^text: starts with)`
+                    : `Search by ${label.toLowerCase()}…`
+                }
                 className="mt-0.5 w-full rounded border border-gray-300 px-2 py-1.5 text-sm focus:border-gray-500 focus:outline-none focus:ring-1 focus:ring-gray-500"
               />
             </div>
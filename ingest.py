@@ -5,14 +5,14 @@ Handles parsing, normalization, enrichment, and database insertion.
 
 import os
 import re
+import hashlib
 import logging
 from typing import Dict, List, Any, Optional, Callable
 import pandas as pd
 
-from config import config, BASE_COLUMNS, COLUMN_MAPPINGS
+from config import config, BASE_COLUMNS, ALIAS_TO_STANDARD, APOLLO_COLUMN_PREFIXES
 from utils import (
-    setup_logging, extract_domain, validate_email,
-    normalize_company_name, get_utc_timestamp, mask_pii
+    setup_logging, get_utc_timestamp, mask_pii_series, EMAIL_MAX_LENGTH, EMAIL_PATTERN
 )
 from db import DatabaseManager
 from apollo import ApolloClient
@@ -27,6 +27,18 @@ except ImportError:
 
 logger = setup_logging(config.LOG_LEVEL, config.LOG_FILE, config.LOG_TO_CONSOLE)
 
+# Duplicate-style column names pandas creates for repeated headers (e.g. "Email.1")
+_DUP_COL_RE = re.compile(r"^.+\.\d+$")
+# Pandas index columns from re-uploaded exports (e.g. "Unnamed: 0")
+_UNNAMED_RE = re.compile(r"^Unnamed:\s*\d+$", re.IGNORECASE)
+# Host part of a URL with optional http(s) scheme (stops at path, query or fragment)
+_URL_HOST_RE = re.compile(r"^(?:https?://)?([^/?#]*)")
+_WWW_PREFIX_RE = re.compile(r"^www\.")
+_WHITESPACE_RE = re.compile(r"\s+")
+# Part of every snapshot key; bump when parsing, normalization, dedup or the
+# merged enrichment columns change so older snapshots are not reused
+SNAPSHOT_VERSION = 2
+
 
 class ExcelIngestor:
     """
@@ -86,16 +98,26 @@ class ExcelIngestor:
         }
 
         try:
-            # Stage 1: Parse Excel
-            self._update_progress(progress_callback, "Parsing Excel file", 0, 100)
-            df = self.parse_excel(file_path)
-            results["warnings"] = list(self._last_parse_warnings)
-            logger.info(f"Parsed {len(df)} rows from Excel")
+            # Reuse snapshots of earlier runs on the same file content (CACHE_DIR)
+            cache_key = self._cache_key(file_path)
+            df = self._read_snapshot(cache_key, "normalized")
 
-            # Stage 2: Normalize and validate
-            self._update_progress(progress_callback, "Normalizing data", 10, 100)
-            df = self.normalize_dataframe(df)
-            logger.info(f"Normalized to {len(df)} valid rows")
+            if df is not None:
+                results["warnings"] = list(df.attrs.get("parse_warnings", []))
+                logger.info(f"Loaded {len(df)} normalized rows from cache")
+            else:
+                # Stage 1: Parse Excel
+                self._update_progress(progress_callback, "Parsing Excel file", 0, 100)
+                df = self.parse_excel(file_path)
+                results["warnings"] = list(self._last_parse_warnings)
+                logger.info(f"Parsed {len(df)} rows from Excel")
+
+                # Stage 2: Normalize and validate
+                self._update_progress(progress_callback, "Normalizing data", 10, 100)
+                df = self.normalize_dataframe(df)
+                logger.info(f"Normalized to {len(df)} valid rows")
+                df.attrs["parse_warnings"] = list(results["warnings"])
+                self._write_snapshot(df, cache_key, "normalized")
 
             # No rows to process (empty file or all rows dropped)
             if len(df) == 0:
@@ -127,9 +149,21 @@ class ExcelIngestor:
             # Stage 4: Enrichment
             if enrich_people or enrich_companies:
                 self._update_progress(progress_callback, "Enriching data", 30, 100)
-                df, enrich_stats = self.enrich_records(
-                    df, enrich_people, enrich_companies, progress_callback
-                )
+                stage = f"enriched-p{int(enrich_people)}c{int(enrich_companies)}"
+                enriched_df = self._read_snapshot(cache_key, stage)
+                # Snapshots with failed Apollo calls are never reused, so a
+                # re-upload retries enrichment instead of replaying the errors
+                if enriched_df is not None and not _has_enrichment_failures(enriched_df):
+                    df = enriched_df
+                    enrich_stats = dict(df.attrs.get("enrich_stats", {}))
+                    logger.info(f"Loaded {len(df)} enriched rows from cache")
+                else:
+                    df, enrich_stats = self.enrich_records(
+                        df, enrich_people, enrich_companies, progress_callback
+                    )
+                    df.attrs["enrich_stats"] = dict(enrich_stats)
+                    if not _has_enrichment_failures(df):
+                        self._write_snapshot(df, cache_key, stage)
                 results["people_enriched"] = enrich_stats.get("people", 0)
                 results["orgs_enriched"] = enrich_stats.get("orgs", 0)
                 results["org_enrichment_skipped_no_domain"] = enrich_stats.get(
@@ -148,12 +182,7 @@ class ExcelIngestor:
             results["skipped_no_email"] = db_stats.get("skipped_no_email", 0)
 
             # Collect errors
-            for idx, row in df.iterrows():
-                if "_enrichment_error" in row and row["_enrichment_error"]:
-                    results["errors"].append({
-                        "email": mask_pii(row.get("Email ID (unique)", "Unknown")),
-                        "message": str(row["_enrichment_error"])
-                    })
+            results["errors"].extend(_collect_enrichment_errors(df))
 
             self._update_progress(progress_callback, "Complete", 100, 100)
             logger.info(f"Processing complete: {results}")
@@ -170,6 +199,66 @@ class ExcelIngestor:
 
         return results
 
+    def _cache_key(self, file_path: str) -> Optional[str]:
+        """
+        Return SHA-256 of SNAPSHOT_VERSION and the file content, or None when
+        CACHE_DIR is not set.
+
+        Args:
+            file_path: Path to Excel file
+
+        Returns:
+            Hex digest used to name snapshot files
+        """
+        if not config.CACHE_DIR:
+            return None
+        digest = hashlib.sha256(f"v{SNAPSHOT_VERSION}:".encode())
+        with open(file_path, "rb") as f:
+            for block in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(block)
+        return digest.hexdigest()
+
+    def _read_snapshot(self, cache_key: Optional[str], stage: str) -> Optional[pd.DataFrame]:
+        """
+        Load a Parquet snapshot written by an earlier run, if present.
+
+        Args:
+            cache_key: Content hash from _cache_key (None disables caching)
+            stage: Snapshot name (e.g. "normalized")
+
+        Returns:
+            Cached DataFrame (attrs restored), or None on miss or read failure
+        """
+        if not cache_key:
+            return None
+        path = os.path.join(config.CACHE_DIR, f"{cache_key}.{stage}.parquet")
+        if not os.path.isfile(path):
+            return None
+        try:
+            return pd.read_parquet(path, engine="pyarrow")
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable cache snapshot {path}: {e}")
+            return None
+
+    def _write_snapshot(self, df: pd.DataFrame, cache_key: Optional[str], stage: str) -> None:
+        """
+        Write df as a zstd-compressed Parquet snapshot; failures are logged, not raised.
+
+        Args:
+            df: DataFrame to snapshot
+            cache_key: Content hash from _cache_key (None disables caching)
+            stage: Snapshot name (e.g. "normalized")
+        """
+        if not cache_key:
+            return
+        path = os.path.join(config.CACHE_DIR, f"{cache_key}.{stage}.parquet")
+        try:
+            os.makedirs(config.CACHE_DIR, exist_ok=True)
+            df.to_parquet(path, engine="pyarrow", compression="zstd", index=False)
+            logger.debug(f"Wrote cache snapshot {path}")
+        except Exception as e:
+            logger.warning(f"Could not write cache snapshot {path}: {e}")
+
     def parse_excel(self, file_path: str) -> pd.DataFrame:
         """
         Parse Excel file with flexible column detection.
@@ -193,18 +282,16 @@ class ExcelIngestor:
 
         logger.info(f"Reading Excel file ({file_size_mb:.1f}MB)")
 
-        self._last_parse_warnings = []
-        with pd.ExcelFile(file_path, engine="openpyxl") as xl:
-            sheet_names = xl.sheet_names
-            if len(sheet_names) > 1:
-                self._last_parse_warnings.append(
-                    "Multiple sheets detected; only the first sheet was read."
-                )
-            df = pd.read_excel(xl, sheet_name=0)
+        try:
+            df = self._read_first_sheet(file_path, engine="calamine")
+        except Exception as e:
+            # python-calamine not installed, or a workbook feature it rejects
+            logger.debug(f"calamine could not read workbook ({e}); using openpyxl")
+            df = self._read_first_sheet(file_path, engine="openpyxl")
 
         if config.MAX_ROWS > 0 and len(df) > config.MAX_ROWS:
             raise ValueError(
-                f"File has {len(df)} rows (max: {config.MAX_ROWS}). "
+                f"File has more than {config.MAX_ROWS} rows (max: {config.MAX_ROWS}). "
                 "Set MAX_ROWS in .env to allow more, or reduce the file size."
             )
 
@@ -213,17 +300,47 @@ class ExcelIngestor:
         # Detect and map columns
         df = self._detect_and_map_columns(df)
 
-        # Warn if pandas created duplicate-style column names (e.g. email.1)
-        duplicate_suffix = re.compile(r"^.+\.\d+$", re.IGNORECASE)
-        dup_cols = [c for c in df.columns if duplicate_suffix.match(str(c).strip())]
-        if dup_cols:
-            self._last_parse_warnings.append(
-                "Duplicate column names detected (e.g. 'Email.1'); "
-                "only the first matching column is used for each field."
-            )
-
         return df
 
+    def _read_first_sheet(self, file_path: str, engine: str) -> pd.DataFrame:
+        """
+        Read the stored columns of the workbook's first sheet as text.
+
+        Args:
+            file_path: Path to Excel file
+            engine: pandas Excel engine ("calamine" or "openpyxl")
+
+        Returns:
+            DataFrame with the original headers of the columns we keep
+        """
+        self._last_parse_warnings = []
+        with pd.ExcelFile(file_path, engine=engine) as xl:
+            sheet_names = xl.sheet_names
+            if len(sheet_names) > 1:
+                self._last_parse_warnings.append(
+                    "Multiple sheets detected; only the first sheet was read."
+                )
+            # Cheap header-only read to pick the columns we actually store (base
+            # columns plus Apollo columns from re-uploaded exports), then
+            # read just those as text so pandas skips per-column type inference
+            header = pd.read_excel(xl, sheet_name=0, nrows=0).columns
+            if any(filter(_DUP_COL_RE.match, map(str.strip, map(str, header)))):
+                self._last_parse_warnings.append(
+                    "Duplicate column names detected (e.g. 'Email.1'); "
+                    "only the first matching column is used for each field."
+                )
+            keep = [
+                i for i, col in enumerate(header)
+                if _is_stored_column(
+                    ALIAS_TO_STANDARD.get(str(col).strip().lower(), str(col).strip()))
+            ]
+            # With a row cap, parse at most one row past it: enough to reject the
+            # file without decoding the rest of an oversized sheet
+            nrows = config.MAX_ROWS + 1 if config.MAX_ROWS > 0 else None
+            return pd.read_excel(
+                xl, sheet_name=0, usecols=keep or None, dtype=str, nrows=nrows
+            )
+
     def _detect_and_map_columns(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Detect columns flexibly and map to standard names.
@@ -234,22 +351,11 @@ class ExcelIngestor:
         Returns:
             DataFrame with standardized column names
         """
-        # Create lowercase version of column names for matching
-        column_map = {}
-
-        for col in df.columns:
-            col_lower = str(col).strip().lower()
-
-            # Try to match against known mappings
-            for standard_col, aliases in COLUMN_MAPPINGS.items():
-                if col_lower in aliases or col_lower == standard_col.lower():
-                    column_map[col] = standard_col
-                    logger.debug(f"Mapped '{col}' -> '{standard_col}'")
-                    break
-
-            # If no match, keep original name
-            if col not in column_map:
-                column_map[col] = col
+        # One hash probe per column against the precomputed alias table
+        column_map = {
+            col: ALIAS_TO_STANDARD.get(str(col).strip().lower(), col)
+            for col in df.columns
+        }
 
         # Rename columns
         df = df.rename(columns=column_map)
@@ -274,8 +380,7 @@ class ExcelIngestor:
             Normalized DataFrame
         """
         # Drop pandas index columns (e.g. "Unnamed: 0") so re-uploaded exports don't fail
-        unnamed_pattern = re.compile(r"^Unnamed:\s*\d+$", re.IGNORECASE)
-        drop_cols = [c for c in df.columns if unnamed_pattern.match(str(c).strip())]
+        drop_cols = [c for c in df.columns if _UNNAMED_RE.match(str(c).strip())]
         if drop_cols:
             df = df.drop(columns=drop_cols)
             logger.debug(f"Dropped index columns: {drop_cols}")
@@ -285,39 +390,27 @@ class ExcelIngestor:
 
         # Extract domain from website URL if present
         if "Website URLs" in df.columns:
-            df["Website URLs"] = df["Website URLs"].apply(
-                lambda x: extract_domain(str(x)) if pd.notna(x) else None
-            )
+            df["Website URLs"] = _domains_from_urls(df["Website URLs"])
 
         # Normalize company names
         if "Company Name (Based on Website Domain)" in df.columns:
-            df["Company Name (Based on Website Domain)"] = df[
-                "Company Name (Based on Website Domain)"
-            ].apply(
-                lambda x: normalize_company_name(str(x)) if pd.notna(x) else None
+            df["Company Name (Based on Website Domain)"] = _normalize_company_names(
+                df["Company Name (Based on Website Domain)"]
             )
 
         # Clean whitespace in text columns
         text_columns = ["First Name", "Last Name", "Job Title", "Email ID (unique)"]
         for col in text_columns:
             if col in df.columns:
-                df[col] = df[col].apply(
-                    lambda x: str(x).strip() if pd.notna(x) else None
-                )
+                df[col] = _as_text(df[col].astype("string").str.strip())
 
         # Validate emails only when column exists; drop invalid or empty
+        # (same rules as utils.validate_email, applied column-wise)
         if "Email ID (unique)" in df.columns:
             original_count = len(df)
-
-            def keep_row_email(val):
-                if pd.isna(val):
-                    return False
-                s = str(val).strip()
-                if not s:
-                    return False
-                return validate_email(s)
-
-            df = df[df["Email ID (unique)"].apply(keep_row_email)]
+            emails = df["Email ID (unique)"]
+            valid = emails.str.len().le(EMAIL_MAX_LENGTH) & emails.str.match(EMAIL_PATTERN)
+            df = df[valid.fillna(False).astype(bool)]
             dropped = original_count - len(df)
             if dropped > 0:
                 logger.warning(f"Dropped {dropped} rows with missing or invalid emails")
@@ -326,8 +419,14 @@ class ExcelIngestor:
         df["Lead Source"] = lead_source if lead_source is not None else "Excel Upload"
         df["Email Send (Yes/No)"] = df.get("Email Send (Yes/No)", "No")
 
-        # Fill NaN with empty string for consistency
-        df = df.fillna("")
+        # Truth columns are TEXT in the database: give them (and any free-text object
+        # columns) non-null strings here instead of a frame-wide fillna, so numeric
+        # extras keep their dtype and untouched columns are not copied
+        for i, (col, dtype) in enumerate(df.dtypes.items()):
+            if isinstance(dtype, pd.StringDtype):
+                continue
+            if col in BASE_COLUMNS or dtype == object:
+                df.isetitem(i, _as_text(df.iloc[:, i]))
 
         logger.info("Data normalization complete")
 
@@ -429,9 +528,9 @@ class ExcelIngestor:
                 website = rec.get("Website URLs") and str(rec.get("Website URLs", "")).strip()
                 return bool(email or (first and last) or company or website)
 
-            mask = df.apply(lambda row: has_people_identifier(row.to_dict()), axis=1)
-            subset_idx = df.index[mask].tolist()
-            records_subset = df.loc[mask].to_dict("records")
+            # One pass over the prebuilt records: no per-row Series boxing
+            mask = [has_people_identifier(r) for r in records]
+            records_subset = [r for r, m in zip(records, mask) if m]
 
             if records_subset:
                 enriched_subset = self.apollo.enrich_people_bulk(records_subset)
@@ -442,16 +541,12 @@ class ExcelIngestor:
                 enriched_subset = []
 
             # Build full-length list: enriched where we called API, else original + skip marker
-            enriched_people_full: List[Dict[str, Any]] = []
-            j = 0
-            for i, row in df.iterrows():
-                if i in subset_idx:
-                    enriched_people_full.append(enriched_subset[j])
-                    j += 1
-                else:
-                    d = row.to_dict()
-                    d["_enrichment_error"] = "Skipped (no identifier for matching)"
-                    enriched_people_full.append(d)
+            enriched_iter = iter(enriched_subset)
+            enriched_people_full: List[Dict[str, Any]] = [
+                next(enriched_iter) if m
+                else {**r, "_enrichment_error": "Skipped (no identifier for matching)"}
+                for r, m in zip(records, mask)
+            ]
 
             df = self._merge_enriched_data(df, enriched_people_full)
             logger.info(f"People enrichment complete: {stats['people']} enriched")
@@ -484,27 +579,40 @@ class ExcelIngestor:
         Returns:
             Merged DataFrame
         """
-        # Convert enriched records to DataFrame
-        enriched_df = pd.DataFrame(enriched_records)
+        if not enriched_records:
+            return df
+
+        # Align positionally with df so a non-range index still lines up
+        enriched_df = pd.DataFrame(enriched_records, index=df.index)
 
-        # Update original DataFrame with enriched data
-        # For each column in enriched_df, update df if value is not empty
-        for col in enriched_df.columns:
-            if col not in df.columns:
-                df[col] = ""
+        missing = [c for c in enriched_df.columns if c not in df.columns]
+        if missing:
+            df = df.assign(**{c: "" for c in missing})
 
-            # Update non-empty values
-            mask = enriched_df[col].notna() & (enriched_df[col] != "")
-            df.loc[mask, col] = enriched_df.loc[mask, col]
+        # Non-empty enriched cells win; empty ones keep the original value.
+        # Only columns with at least one such cell are touched (usually none
+        # on all-error batches), and they are overlaid in one frame-wide mask
+        filled = enriched_df.notna() & enriched_df.ne("")
+        cols = filled.columns[filled.any()]
+        if len(cols):
+            df[cols] = df[cols].mask(filled[cols], enriched_df[cols])
 
         return df
 
-    def save_to_database(self, df: pd.DataFrame) -> Dict[str, Any]:
+    def save_to_database(
+        self,
+        df: pd.DataFrame,
+        chunk_size: int = 5000
+    ) -> Dict[str, Any]:
         """
         Upsert all records to database.
 
+        Rows are stringified and written one chunk at a time so memory stays
+        bounded by chunk_size rather than the full enriched file.
+
         Args:
             df: DataFrame with records to save
+            chunk_size: Number of rows stringified and upserted per batch
 
         Returns:
             Statistics dictionary (inserted, updated, failed, skipped_no_email,
@@ -512,37 +620,41 @@ class ExcelIngestor:
         """
         logger.info(f"Saving {len(df)} records to database")
 
-        # Convert DataFrame to list of dicts
-        records = df.to_dict('records')
-
-        # Clean up records - ensure all base columns present
-        cleaned_records = []
+        stats: Dict[str, Any] = {
+            "inserted": 0,
+            "updated": 0,
+            "failed": 0,
+            "inserted_emails": [],
+            "updated_emails": [],
+            "failed_records": [],
+        }
         skipped_no_email = 0
-        for record in records:
-            cleaned = {}
-
-            # Add all columns from record
-            for key, value in record.items():
-                # Skip internal fields
-                if key.startswith("_"):
-                    continue
-
-                # Convert to string, handle NaN/None
-                if pd.isna(value) or value == "":
-                    cleaned[key] = ""
-                else:
-                    cleaned[key] = str(value)
+        internal_cols = [c for c in df.columns if str(c).startswith("_")]
+        # One load time for the whole file, shared by every chunk
+        timestamp = get_utc_timestamp()
+
+        for start in range(0, len(df), chunk_size):
+            chunk = df.iloc[start:start + chunk_size]
+
+            # Stringify column-wise (missing -> ""), dropping internal "_" fields
+            out = chunk.drop(columns=internal_cols).astype("string").fillna("")
 
             # Ensure Email ID is present
-            if not cleaned.get("Email ID (unique)"):
-                logger.warning("Skipping record without email")
-                skipped_no_email += 1
-                continue
+            if "Email ID (unique)" in out.columns:
+                has_email = out["Email ID (unique)"].str.strip().ne("")
+            else:
+                has_email = pd.Series(False, index=out.index)
+            skipped_no_email += int((~has_email).sum())
 
-            cleaned_records.append(cleaned)
+            # Batch upsert (failed = only records that raised during upsert)
+            _, chunk_stats = self.db.upsert_batch(
+                out.loc[has_email].to_dict("records"), timestamp=timestamp
+            )
+            for key in stats:
+                stats[key] += chunk_stats[key]
 
-        # Batch upsert (failed = only records that raised during upsert)
-        _, stats = self.db.upsert_batch(cleaned_records)
+        if skipped_no_email:
+            logger.warning(f"Skipped {skipped_no_email} records without email")
         stats["skipped_no_email"] = skipped_no_email
 
         logger.info(
@@ -660,58 +772,22 @@ def process_scrape(
     _update_progress(progress_callback, "Saving to database", 80, 100)
 
     # Count rows that will be skipped (no email after enrichment) and capture names/orgs for UI
+    display = _display_names(df)
     if "Email ID (unique)" in df.columns:
         no_email = df["Email ID (unique)"].isna() | (df["Email ID (unique)"].astype(str).str.strip() == "")
-        results["skipped_no_email"] = int(no_email.sum())
-        skipped_df = df.loc[no_email]
-        results["skipped_no_email_records"] = [
-            {
-                "First Name": _str_val(row.get("First Name")),
-                "Last Name": _str_val(row.get("Last Name")),
-                "Company Name (Based on Website Domain)": _str_val(
-                    row.get("Company Name (Based on Website Domain)")
-                ),
-            }
-            for _, row in skipped_df.iterrows()
-        ]
-        # Records that will be saved (have email) — for UI to show names/orgs of updated & new
-        has_email = ~no_email
-        saved_df = df.loc[has_email]
-        results["saved_records"] = [
-            {
-                "First Name": _str_val(row.get("First Name")),
-                "Last Name": _str_val(row.get("Last Name")),
-                "Company Name (Based on Website Domain)": _str_val(
-                    row.get("Company Name (Based on Website Domain)")
-                ),
-            }
-            for _, row in saved_df.iterrows()
-        ]
     else:
-        results["skipped_no_email"] = len(df)
-        results["skipped_no_email_records"] = [
-            {
-                "First Name": _str_val(row.get("First Name")),
-                "Last Name": _str_val(row.get("Last Name")),
-                "Company Name (Based on Website Domain)": _str_val(
-                    row.get("Company Name (Based on Website Domain)")
-                ),
-            }
-            for _, row in df.iterrows()
-        ]
-        results["saved_records"] = []
+        no_email = pd.Series(True, index=df.index)
+    results["skipped_no_email"] = int(no_email.sum())
+    results["skipped_no_email_records"] = display.loc[no_email].to_dict("records")
+    # Records that will be saved (have email) — for UI to show names/orgs of updated & new
+    results["saved_records"] = display.loc[~no_email].to_dict("records")
 
     db_stats = ingestor.save_to_database(df)
     results["new_inserts"] = db_stats["inserted"]
     results["updates"] = db_stats["updated"]
     results["failed"] = db_stats["failed"]
 
-    for idx, row in df.iterrows():
-        if row.get("_enrichment_error"):
-            results["errors"].append({
-                "email": mask_pii(row.get("Email ID (unique)", "Unknown")),
-                "message": str(row["_enrichment_error"]),
-            })
+    results["errors"].extend(_collect_enrichment_errors(df))
 
     _update_progress(progress_callback, "Complete", 100, 100)
     db.close()
@@ -719,11 +795,56 @@ def process_scrape(
     return results
 
 
-def _str_val(val: Any) -> str:
-    """Return non-empty string for display; empty string for NaN/None/blank."""
-    if pd.isna(val) or val is None or str(val).strip() == "":
-        return ""
-    return str(val).strip()
+def _collect_enrichment_errors(df: pd.DataFrame) -> List[Dict[str, str]]:
+    """Return {email, message} entries (email PII-masked) for rows with an enrichment error."""
+    if "_enrichment_error" not in df.columns:
+        return []
+    errors = df["_enrichment_error"]
+    err_mask = errors.notna() & errors.astype(str).ne("")
+    if "Email ID (unique)" in df.columns:
+        emails = df.loc[err_mask, "Email ID (unique)"].fillna("Unknown").astype(str).pipe(mask_pii_series)
+    else:
+        emails = ["Unknown"] * int(err_mask.sum())
+    return [
+        {"email": email, "message": message}
+        for email, message in zip(emails, errors[err_mask].astype(str))
+    ]
+
+
+def _has_enrichment_failures(df: pd.DataFrame) -> bool:
+    """True if any row has an enrichment error other than a "Skipped ..." marker."""
+    if "_enrichment_error" not in df.columns:
+        return False
+    errors = df["_enrichment_error"].dropna().astype(str)
+    return bool((errors.ne("") & ~errors.str.startswith("Skipped")).any())
+
+
+def _is_stored_column(col: str) -> bool:
+    """True for columns persisted to the Truth table: base columns and Apollo enrichment columns."""
+    return col in BASE_COLUMNS or col.startswith(APOLLO_COLUMN_PREFIXES)
+
+
+def _as_text(series: pd.Series) -> pd.Series:
+    """Return series as pandas string dtype with missing values as empty strings."""
+    return series.astype("string").fillna("")
+
+
+def _domains_from_urls(urls: pd.Series) -> pd.Series:
+    """Vectorized utils.extract_domain: lowercased host without scheme or www. ("" if missing)."""
+    hosts = urls.astype("string").str.extract(_URL_HOST_RE, expand=False)
+    return _as_text(hosts.str.replace(_WWW_PREFIX_RE, "", regex=True).str.lower())
+
+
+def _normalize_company_names(names: pd.Series) -> pd.Series:
+    """Vectorized utils.normalize_company_name: collapse whitespace, strip, title case."""
+    collapsed = names.astype("string").str.replace(_WHITESPACE_RE, " ", regex=True).str.strip()
+    return _as_text(collapsed.str.title())
+
+
+def _display_names(df: pd.DataFrame) -> pd.DataFrame:
+    """Name/company columns as stripped text ("" for missing) for UI summaries."""
+    cols = ["First Name", "Last Name", "Company Name (Based on Website Domain)"]
+    return df.reindex(columns=cols).astype("string").fillna("").apply(lambda s: s.str.strip())
 
 
 def _update_progress(
@@ -4,16 +4,23 @@ Uses HTML-first extraction (fetch + LLM) when enabled, with Apify browser actor
 as fallback for JS-heavy pages or when HTML extraction returns no items.
 """
 
+import hashlib
 import json
 import logging
 import re
-from typing import Any, Optional
+import sqlite3
+import threading
+import time
+from typing import Any, Iterable, Optional
 
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
 
 from config import config, BASE_COLUMNS
-from utils import setup_logging
+from utils import setup_logging, json_loads, json_dumps_bytes
 
 logger = setup_logging(config.LOG_LEVEL, config.LOG_FILE,
                        config.LOG_TO_CONSOLE)
@@ -23,6 +30,140 @@ HTML_FETCH_USER_AGENT = (
     "Mozilla/5.0 (Windows NT 10.0; rv:109.0) Gecko/20100101 Firefox/115.0"
 )
 
+# Longest Retry-After (seconds) honored when a page responds 429/503
+HTML_RETRY_AFTER_MAX_SECS = 30
+
+# Transient page statuses retried by the HTML session adapter
+HTML_RETRY_STATUSES = (429, 502, 503, 504)
+HTML_FETCH_RETRIES = 2
+HTML_RETRY_BACKOFF_FACTOR = 0.3
+
+
+class _CappedRetry(Retry):
+    """urllib3 Retry that honors Retry-After but never waits longer than the cap."""
+
+    def get_retry_after(self, response: Any) -> Optional[float]:
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, HTML_RETRY_AFTER_MAX_SECS)
+
+
+# Shared session for HTML fetches: keeps connections (and TLS sessions) alive
+# across pages instead of a fresh handshake per requests.get call
+_SESSION = requests.Session()
+# ACCEPT_ENCODING lists only codecs urllib3 can decode here (br when brotli is
+# installed); compressed transfer cuts bytes over the wire several-fold for HTML
+_SESSION.headers.update({
+    "User-Agent": HTML_FETCH_USER_AGENT,
+    "Accept-Encoding": ACCEPT_ENCODING,
+})
+# 429/503 responses are retried after their Retry-After delay (capped); other
+# transient 5xx use exponential backoff
+_HTML_ADAPTER = HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=64,
+    max_retries=_CappedRetry(
+        total=HTML_FETCH_RETRIES,
+        backoff_factor=HTML_RETRY_BACKOFF_FACTOR,
+        status_forcelist=list(HTML_RETRY_STATUSES),
+    ),
+)
+_SESSION.mount("https://", _HTML_ADAPTER)
+_SESSION.mount("http://", _HTML_ADAPTER)
+
+# Structured-output schemas for HTML extraction: the API guarantees parseable
+# JSON matching these, so replies need no fence stripping or shape checks.
+# Strict mode requires every property to be listed as required.
+_PERSON_ITEMS_SCHEMA = {
+    "type": "array",
+    "items": {
+        "type": "object",
+        "properties": {
+            "firstName": {"type": "string"},
+            "lastName": {"type": "string"},
+            "organization": {"type": "string"},
+            "email": {"type": "string"},
+        },
+        "required": ["firstName", "lastName", "organization", "email"],
+        "additionalProperties": False,
+    },
+}
+EXTRACTION_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "people",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {"items": _PERSON_ITEMS_SCHEMA},
+            "required": ["items"],
+            "additionalProperties": False,
+        },
+    },
+}
+
+# Lowercased actor output key -> (normalized field, priority; lower wins)
+_ITEM_KEY_FIELDS: dict[str, tuple[str, int]] = {
+    "name": ("name", 0),
+    **{k: ("firstName", i) for i, k in enumerate(("firstname", "first_name"))},
+    **{k: ("lastName", i) for i, k in enumerate(("lastname", "last_name"))},
+    **{
+        k: ("organization", i)
+        for i, k in enumerate(
+            ("organization", "organisation", "company", "companyname", "company_name", "org")
+        )
+    },
+    **{k: ("email", i) for i, k in enumerate(("email", "emailaddress", "email_address"))},
+}
+
+# Fetched HTML is capped at MAX_HTML_CHARS * this before boilerplate stripping
+HTML_FETCH_BUDGET_FACTOR = 4
+
+# Token-wasting markup removed before HTML is sent to the LLM: non-content
+# elements plus site-wide navigation/footer chrome repeated on every page
+_BOILERPLATE_BLOCK_RE = re.compile(
+    r"<(script|style|svg|noscript|template|nav|footer)\b[^>]*>.*?</\1\s*>", re.S | re.I
+)
+_HTML_COMMENT_RE = re.compile(r"<!--.*?-->", re.S)
+_NOISE_ATTR_RE = re.compile(
+    r"""\s(?:(?:class|style|data-[\w-]+)\s*=\s*(?:"[^"]*"|'[^']*')"""
+    r"""|src\s*=\s*(?:"data:[^"]*"|'data:[^']*'))""",
+    re.I,
+)
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# Shared OpenAI client (see _get_openai); created lazily
+_openai_client: Any = None
+
+# On-disk cache of LLM extraction results (see _get_llm_cache); opened lazily.
+# Entries older than LLM_CACHE_TTL_SECS are ignored, and expired / excess rows
+# (beyond LLM_CACHE_MAX_ROWS, oldest first) are pruned on open and every
+# LLM_CACHE_PRUNE_EVERY writes so the file stays bounded
+_llm_cache: Optional[sqlite3.Connection] = None
+_llm_cache_lock = threading.Lock()
+_llm_cache_writes = 0
+LLM_CACHE_MAX_ROWS = 50_000
+LLM_CACHE_PRUNE_EVERY = 500
+
+# Structured (selector-based) extraction: person containers, their name and
+# organization elements, and a name sanity check (2-4 capitalized words) so
+# bios, job titles and sentences are not taken for names. With at least
+# STRUCTURED_MIN_ITEMS people found, the LLM call is skipped.
+_PERSON_NODE_SELECTOR = (
+    '[itemtype*="schema.org/Person"], .team-member, .person, '
+    '[class*="team-member"], [class*="person-card"], [class*="profile-card"]'
+)
+_PERSON_NAME_SELECTOR = '[itemprop="name"], .name, h2, h3, h4, strong'
+_PERSON_ORG_SELECTOR = (
+    '[itemprop="worksFor"], [itemprop="affiliation"], .company, .organization, [class*="company"]'
+)
+_PERSON_NAME_RE = re.compile(r"^[A-Z][\w'.-]*(?: [A-Z][\w'.-]*){1,3}$")
+STRUCTURED_MIN_ITEMS = 3
+
+# Prompts up to this size (and without tables) try the cheap model first
+CHEAP_MODEL_MAX_CHARS = 20_000
+
 
 class ScraperError(Exception):
     """Raised when Apify run fails (timeout, actor error, no token, no dataset)."""
@@ -34,45 +175,43 @@ def _normalize_item(item: dict[str, Any]) -> dict[str, Any]:
     Normalize actor output to consistent shape: firstName, lastName, organization.
     Handles various actor output formats (name vs firstName+lastName, etc.).
     """
+    # Single pass over the item: keep the highest-priority alias seen per field
+    found: dict[str, str] = {}
+    ranks: dict[str, int] = {}
+    for key, value in item.items():
+        spec = _ITEM_KEY_FIELDS.get(key.lower() if isinstance(key, str) else str(key).lower())
+        if spec is None or value is None:
+            continue
+        # Strip once, only for keys we use; the stripped text is what gets stored
+        text = (value if isinstance(value, str) else str(value)).strip()
+        if not text:
+            continue
+        field, rank = spec
+        if rank <= ranks.get(field, rank):
+            found[field] = text
+            ranks[field] = rank
+
     normalized: dict[str, Any] = {}
-    item_lower = {str(k).lower(): v for k, v in item.items()
-                  if v is not None and str(v).strip()}
-
-    # First name
-    for key in ("firstname", "first_name", "firstName"):
-        if key in item_lower:
-            normalized["firstName"] = str(item_lower[key]).strip()
-            break
-    if "firstName" not in normalized and "name" in item_lower:
-        name = str(item_lower["name"]).strip()
-        parts = name.split(None, 1)
-        normalized["firstName"] = parts[0] if parts else ""
+    if "firstName" in found:
+        normalized["firstName"] = found["firstName"]
+    elif "name" in found:
+        parts = found["name"].split(None, 1)
+        normalized["firstName"] = parts[0]
         if len(parts) > 1:
             normalized["lastName"] = parts[1]
-    if "firstName" not in normalized:
+    else:
         normalized["firstName"] = ""
 
-    # Last name
-    for key in ("lastname", "last_name", "lastName"):
-        if key in item_lower:
-            normalized["lastName"] = str(item_lower[key]).strip()
-            break
-    if "lastName" not in normalized:
-        normalized["lastName"] = normalized.get("lastName", "")
-
-    # Organization / company
-    for key in ("organization", "organisation", "company", "companyname", "company_name", "org"):
-        if key in item_lower:
-            normalized["organization"] = str(item_lower[key]).strip()
-            break
-    if "organization" not in normalized:
-        normalized["organization"] = ""
+    if "lastName" in found:
+        normalized["lastName"] = found["lastName"]
+    else:
+        normalized.setdefault("lastName", "")
+
+    normalized["organization"] = found.get("organization", "")
 
     # Email if present
-    for key in ("email", "emailaddress", "email_address"):
-        if key in item_lower:
-            normalized["email"] = str(item_lower[key]).strip()
-            break
+    if "email" in found:
+        normalized["email"] = found["email"]
 
     return normalized
 
@@ -80,23 +219,37 @@ def _normalize_item(item: dict[str, Any]) -> dict[str, Any]:
 def _fetch_html(url: str) -> Optional[str]:
     """
     Fetch page HTML with a browser-like User-Agent and timeout.
+    Streams the body and stops once well past MAX_HTML_CHARS (pre-strip budget),
+    so huge pages are never fully downloaded.
     Returns None on failure (network error, timeout, non-2xx).
     """
     try:
-        resp = requests.get(
-            url,
-            timeout=config.HTML_FETCH_TIMEOUT_SECS,
-            headers={"User-Agent": HTML_FETCH_USER_AGENT},
-        )
-        resp.raise_for_status()
-        if resp.encoding is None:
-            resp.encoding = "utf-8"
-        return resp.text
+        with _SESSION.get(url, timeout=config.HTML_FETCH_TIMEOUT_SECS, stream=True) as resp:
+            resp.raise_for_status()
+            if resp.encoding is None:
+                resp.encoding = "utf-8"
+            budget = config.MAX_HTML_CHARS * HTML_FETCH_BUDGET_FACTOR
+            chunks: list[str] = []
+            size = 0
+            for chunk in resp.iter_content(chunk_size=65536, decode_unicode=True):
+                chunks.append(chunk)
+                size += len(chunk)
+                if size >= budget:
+                    break
+            return "".join(chunks)
     except Exception as e:
         logger.debug("HTML fetch failed for %s: %s", url, e)
         return None
 
 
+def _strip_boilerplate(html: str) -> str:
+    """Drop scripts/styles/SVG, nav/footer chrome, comments, presentational attributes and extra whitespace."""
+    html = _BOILERPLATE_BLOCK_RE.sub("", html)
+    html = _HTML_COMMENT_RE.sub("", html)
+    html = _NOISE_ATTR_RE.sub("", html)
+    return _WHITESPACE_RE.sub(" ", html).strip()
+
+
 def _truncate_html(html: str, max_chars: int) -> str:
     """Truncate HTML to stay within LLM context and cost limits."""
     if len(html) <= max_chars:
@@ -104,13 +257,52 @@ def _truncate_html(html: str, max_chars: int) -> str:
     return html[:max_chars] + "\n[... truncated ...]"
 
 
+def _extract_from_html_structured(html: str, url: str) -> list[dict[str, Any]]:
+    """
+    Deterministic extraction from marked-up people: schema.org Person microdata
+    and team/person cards. No LLM call; returns [] when selectolax is not
+    installed or nothing matches.
+    """
+    try:
+        from selectolax.parser import HTMLParser
+    except ImportError:
+        return []
+
+    try:
+        tree = HTMLParser(html)
+    except Exception as e:
+        logger.debug("Structured HTML parse failed for %s: %s", url, e)
+        return []
+
+    raw_items: list[dict[str, str]] = []
+    seen: set[tuple[str, str]] = set()
+    for node in tree.css(_PERSON_NODE_SELECTOR):
+        name_node = node.css_first(_PERSON_NAME_SELECTOR)
+        if name_node is None:
+            continue
+        name = _WHITESPACE_RE.sub(" ", name_node.text(strip=True, separator=" ")).strip()
+        if not _PERSON_NAME_RE.match(name):
+            continue
+        org_node = node.css_first(_PERSON_ORG_SELECTOR)
+        org = _WHITESPACE_RE.sub(" ", org_node.text(strip=True, separator=" ")).strip() if org_node else ""
+        if (name, org) in seen:
+            continue
+        seen.add((name, org))
+        raw_items.append({"name": name, "organization": org})
+
+    items = _normalize_items(raw_items)
+    if items:
+        logger.debug("Structured extraction found %s people on %s", len(items), url)
+    return items
+
+
 def _extract_from_html_with_llm(html: str, url: str) -> list[dict[str, Any]]:
     """
-    Send HTML to OpenAI with extraction prompt; parse JSON array and normalize.
+    Send HTML to OpenAI with extraction prompt; parse the structured reply and normalize.
     Returns list of normalized items, or empty list on parse/API error.
     """
     try:
-        from openai import OpenAI
+        import openai  # noqa: F401
     except ImportError:
         logger.debug("openai not installed, skipping HTML LLM extraction")
         return []
@@ -118,49 +310,201 @@ def _extract_from_html_with_llm(html: str, url: str) -> list[dict[str, Any]]:
     if not config.OPENAI_API_KEY:
         return []
 
-    truncated = _truncate_html(html, config.MAX_HTML_CHARS)
+    messages = _extraction_messages(html)
+    max_rpm = config.OPENAI_MAX_RPM
+    for model in _extraction_models(messages):
+        cache_key = _llm_cache_key(model, messages)
+        items = _llm_cache_get(cache_key)
+        if items is None:
+            try:
+                client = _get_openai()
+                _openai_rate_limiter.wait(max_rpm)
+                resp = client.chat.completions.create(
+                    model=model,
+                    messages=messages,
+                    response_format=EXTRACTION_RESPONSE_FORMAT,
+                    temperature=0,
+                )
+                text = resp.choices[0].message.content
+                items = _normalize_items(json_loads(text)["items"]) if text else []
+                if text:
+                    _llm_cache_put(cache_key, items)
+            except json.JSONDecodeError as e:
+                logger.debug("LLM extraction JSON parse error for %s (%s): %s", url, model, e)
+                items = []
+            except Exception as e:
+                logger.debug("LLM extraction failed for %s (%s): %s", url, model, e)
+                items = []
+        if items:
+            logger.debug("LLM extraction with %s found %s items for %s", model, len(items), url)
+            return items
+    return []
+
+
+def _extraction_models(messages: list[dict[str, str]]) -> list[str]:
+    """
+    Models to try in order for one page. Small pages without tables go to
+    OPENAI_EXTRACTION_MODEL_CHEAP first (when set), escalating to
+    OPENAI_EXTRACTION_MODEL only if the cheap model finds nothing.
+    """
+    cheap = config.OPENAI_EXTRACTION_MODEL_CHEAP
+    model = config.OPENAI_EXTRACTION_MODEL
+    page = messages[-1]["content"]
+    if cheap and cheap != model and len(page) < CHEAP_MODEL_MAX_CHARS and "<table" not in page:
+        return [cheap, model]
+    return [model]
+
+
+def _get_openai() -> Any:
+    """
+    Return the process-wide OpenAI client, creating it on first use. Reusing one
+    client keeps its pooled keep-alive connections to the API warm across calls.
+    """
+    global _openai_client
+    if _openai_client is None:
+        import httpx
+        from openai import OpenAI
+
+        _openai_client = OpenAI(
+            api_key=config.OPENAI_API_KEY,
+            http_client=httpx.Client(
+                limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+                timeout=60,
+            ),
+        )
+    return _openai_client
+
+
+class _RateLimiter:
+    """Spaces calls evenly to stay under a requests-per-minute budget (thread-safe)."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def wait(self, per_minute: int) -> None:
+        """Block until the next call slot; no-op when per_minute <= 0."""
+        if per_minute <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + 60.0 / per_minute
+        if slot > now:
+            time.sleep(slot - now)
+
+
+# Shared by all sync OpenAI calls in the process (see OPENAI_MAX_RPM)
+_openai_rate_limiter = _RateLimiter()
+
+
+def _llm_cache_key(model: str, messages: list[dict[str, str]]) -> str:
+    """Content address for an extraction request: model + prompt (incl. truncated HTML)."""
+    prompt = "\x00".join(m["content"] for m in messages)
+    return hashlib.sha256(f"{model}\x00{prompt}".encode("utf-8")).hexdigest()
+
+
+def _get_llm_cache() -> Optional[sqlite3.Connection]:
+    """Open (once) the on-disk LLM result cache; None when LLM_CACHE_PATH is unset."""
+    global _llm_cache
+    if not config.LLM_CACHE_PATH:
+        return None
+    if _llm_cache is None:
+        conn = sqlite3.connect(config.LLM_CACHE_PATH, check_same_thread=False)
+        with conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS llm_cache ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, created_at REAL NOT NULL DEFAULT 0)"
+            )
+            # Caches written before entries were timestamped: their rows expire at once
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(llm_cache)")}
+            if "created_at" not in columns:
+                conn.execute(
+                    "ALTER TABLE llm_cache ADD COLUMN created_at REAL NOT NULL DEFAULT 0"
+                )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_llm_cache_created_at ON llm_cache(created_at)"
+            )
+        _prune_llm_cache(conn)
+        _llm_cache = conn
+    return _llm_cache
+
+
+def _prune_llm_cache(conn: sqlite3.Connection) -> None:
+    """Delete expired rows, then the oldest rows beyond LLM_CACHE_MAX_ROWS."""
+    with conn:
+        conn.execute(
+            "DELETE FROM llm_cache WHERE created_at < ?",
+            (time.time() - config.LLM_CACHE_TTL_SECS,),
+        )
+        conn.execute(
+            "DELETE FROM llm_cache WHERE key IN ("
+            "SELECT key FROM llm_cache ORDER BY created_at DESC LIMIT -1 OFFSET ?)",
+            (LLM_CACHE_MAX_ROWS,),
+        )
+
+
+def _llm_cache_get(key: str) -> Optional[list[dict[str, Any]]]:
+    """Return cached normalized items for key, or None on miss, expiry or cache error."""
+    try:
+        with _llm_cache_lock:
+            conn = _get_llm_cache()
+            if conn is None:
+                return None
+            row = conn.execute(
+                "SELECT value FROM llm_cache WHERE key = ? AND created_at >= ?",
+                (key, time.time() - config.LLM_CACHE_TTL_SECS),
+            ).fetchone()
+        return json_loads(row[0]) if row else None
+    except Exception as e:
+        logger.debug("LLM cache read failed: %s", e)
+        return None
+
+
+def _llm_cache_put(key: str, items: list[dict[str, Any]]) -> None:
+    """Store normalized items for key; cache errors are logged and ignored."""
+    global _llm_cache_writes
+    try:
+        with _llm_cache_lock:
+            conn = _get_llm_cache()
+            if conn is None:
+                return
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO llm_cache (key, value, created_at) VALUES (?, ?, ?)",
+                    (key, json_dumps_bytes(items).decode("utf-8"), time.time()),
+                )
+            _llm_cache_writes += 1
+            if _llm_cache_writes % LLM_CACHE_PRUNE_EVERY == 0:
+                _prune_llm_cache(conn)
+    except Exception as e:
+        logger.debug("LLM cache write failed: %s", e)
+
+
+def _extraction_messages(html: str) -> list[dict[str, str]]:
+    """Chat messages asking the model to extract people from one page's HTML."""
+    truncated = _truncate_html(_strip_boilerplate(html), config.MAX_HTML_CHARS)
     instruction = (
         "From the following HTML, extract all person names and their organization names. "
-        "Return a JSON array of objects with keys: firstName, lastName, organization (optional). "
+        "Return a JSON object with key 'items': an array of objects with keys firstName, lastName, "
+        "organization and email (use an empty string when unknown). "
         "If only a full name is available use firstName for the full name and leave lastName empty. "
-        "One object per person. Return only the JSON array, no other text or markdown."
+        "One object per person."
     )
-    user_content = f"{instruction}\n\n---\n\nHTML:\n{truncated}"
+    return [
+        {"role": "system", "content": "You extract structured data as JSON."},
+        {"role": "user", "content": f"{instruction}\n\n---\n\nHTML:\n{truncated}"},
+    ]
 
-    try:
-        client = OpenAI(api_key=config.OPENAI_API_KEY)
-        resp = client.chat.completions.create(
-            model=config.OPENAI_EXTRACTION_MODEL,
-            messages=[
-                {"role": "system", "content": "You extract structured data. Reply with a JSON array only."},
-                {"role": "user", "content": user_content},
-            ],
-        )
-        text = (resp.choices[0].message.content or "").strip()
-        if not text:
-            return []
-        # Strip optional markdown code fence
-        if "```" in text:
-            match = re.search(r"```(?:json)?\s*([\s\S]*?)\s*```", text)
-            if match:
-                text = match.group(1).strip()
-        data = json.loads(text)
-        if not isinstance(data, list):
-            return []
-        normalized = []
-        for item in data:
-            if not isinstance(item, dict):
-                continue
-            norm = _normalize_item(item)
-            if norm.get("firstName") or norm.get("lastName") or norm.get("organization"):
-                normalized.append(norm)
-        return normalized
-    except json.JSONDecodeError as e:
-        logger.debug("LLM extraction JSON parse error for %s: %s", url, e)
-        return []
-    except Exception as e:
-        logger.debug("LLM extraction failed for %s: %s", url, e)
-        return []
+
+def _normalize_items(raw_items: Iterable[Any]) -> list[dict[str, Any]]:
+    """Normalize raw extractor items, dropping non-dicts and items with no name or org."""
+    # One fused pass; _normalize_item always sets the three keys checked here
+    return [
+        norm
+        for norm in map(_normalize_item, (x for x in raw_items if isinstance(x, dict)))
+        if norm["firstName"] or norm["lastName"] or norm["organization"]
+    ]
 
 
 def run_ai_extractor(
@@ -194,7 +538,10 @@ def run_ai_extractor(
     if config.ENABLE_HTML_FIRST_EXTRACTION:
         html = _fetch_html(url)
         if html:
-            items = _extract_from_html_with_llm(html, url)
+            items = _extract_from_html_structured(html, url)
+            if len(items) < STRUCTURED_MIN_ITEMS:
+                # Keep the few structured hits when the LLM finds nothing
+                items = _extract_from_html_with_llm(html, url) or items
             if items:
                 logger.info(
                     "HTML extraction extracted %s items from %s",
@@ -207,7 +554,19 @@ def run_ai_extractor(
             url,
         )
 
-    # Apify browser actor fallback (for JS-heavy pages or when HTML path failed)
+    return _run_apify_extractor(url, actor_id, run_input, timeout_secs)
+
+
+def _run_apify_extractor(
+    url: str,
+    actor_id: Optional[str] = None,
+    run_input: Optional[dict[str, Any]] = None,
+    timeout_secs: Optional[int] = None,
+) -> list[dict[str, Any]]:
+    """
+    Run the Apify browser actor for one URL (fallback for JS-heavy pages or when
+    the HTML path failed). Arguments as for run_ai_extractor.
+    """
     if not config.APIFY_API_TOKEN:
         raise ScraperError(
             "APIFY_API_TOKEN is not set. Set it in .env to use Apify fallback for website scraping."
@@ -263,8 +622,25 @@ def run_ai_extractor(
         raise ScraperError("Apify run returned no result.")
 
     items: list[dict[str, Any]] = []
+    default_dataset_id = run.get("defaultDatasetId")
     default_kv_store_id = run.get("defaultKeyValueStoreId")
-    if default_kv_store_id:
+    if not default_dataset_id and not default_kv_store_id:
+        raise ScraperError(
+            "Apify run produced no dataset or key-value store.")
+
+    # Most actors push results to the dataset: read it first in one call and
+    # only touch the key-value store OUTPUT record when the dataset is empty
+    dataset_error: Optional[Exception] = None
+    if default_dataset_id:
+        try:
+            items = client.dataset(default_dataset_id).list_items(
+                clean=True, skip_empty=True
+            ).items
+        except Exception as e:
+            logger.warning("Failed to read Apify dataset: %s", e)
+            dataset_error = e
+
+    if not items and default_kv_store_id:
         try:
             record = client.key_value_store(
                 default_kv_store_id).get_record("OUTPUT")
@@ -282,32 +658,16 @@ def run_ai_extractor(
                 else:
                     raw_items = []
                 if isinstance(raw_items, list):
-                    items = [x for x in raw_items if isinstance(x, dict)]
+                    items = raw_items
         except Exception as e:
             logger.debug("Could not read key-value store OUTPUT: %s", e)
 
-    if not items:
-        default_dataset_id = run.get("defaultDatasetId")
-        if default_dataset_id:
-            try:
-                items = list(client.dataset(
-                    default_dataset_id).iterate_items())
-            except Exception as e:
-                logger.exception("Failed to read Apify dataset")
-                raise ScraperError(
-                    f"Failed to read scrape results: {e}") from e
-        elif not default_kv_store_id:
-            raise ScraperError(
-                "Apify run produced no dataset or key-value store.")
+    if not items and dataset_error is not None:
+        raise ScraperError(
+            f"Failed to read scrape results: {dataset_error}") from dataset_error
 
     # Normalize to consistent shape
-    normalized = []
-    for item in items:
-        if not isinstance(item, dict):
-            continue
-        norm = _normalize_item(item)
-        if norm.get("firstName") or norm.get("lastName") or norm.get("organization"):
-            normalized.append(norm)
+    normalized = _normalize_items(items)
 
     logger.info(f"Apify extracted {len(normalized)} items from {url}")
     return normalized
@@ -337,38 +697,40 @@ def scraped_items_to_truth_rows(
     base_cols_no_email = [
         c for c in base_cols_no_sn if c != "Email ID (unique)"]
 
-    rows: list[dict[str, Any]] = []
+    # One list per field we have (columnar build); reindex fills the rest with ""
+    firsts: list[str] = []
+    lasts: list[str] = []
+    orgs: list[str] = []
+    emails: list[Optional[str]] = []
     for item in items:
         first = (item.get("firstName") or "").strip()
         last = (item.get("lastName") or "").strip()
         org = (item.get("organization") or "").strip()
-        email = (item.get("email") or "").strip()
 
         if not first and not last and not org:
             continue
 
-        row: dict[str, Any] = {col: "" for col in base_cols_no_email}
-        row["First Name"] = first
-        row["Last Name"] = last
-        row["Company Name (Based on Website Domain)"] = org
-        row["Lead Source"] = "Website Scrape"
-        row["Email Send (Yes/No)"] = "No"
+        firsts.append(first)
+        lasts.append(last)
+        orgs.append(org)
+        emails.append((item.get("email") or "").strip() or None)
 
-        if email:
-            row["Email ID (unique)"] = email
-
-        rows.append(row)
-
-    if not rows:
+    if not firsts:
         df = pd.DataFrame(columns=base_cols_no_email)
     else:
-        df = pd.DataFrame(rows)
-        for col in base_cols_no_email:
-            if col not in df.columns:
-                df[col] = ""
+        data = {
+            "First Name": firsts,
+            "Last Name": lasts,
+            "Company Name (Based on Website Domain)": orgs,
+        }
         # Order columns: base_cols_no_sn order, include Email ID only if present
-        ordered = [c for c in base_cols_no_sn if c in df.columns]
-        df = df[ordered]
+        columns = base_cols_no_email
+        if any(emails):
+            data["Email ID (unique)"] = emails
+            columns = base_cols_no_sn
+        df = pd.DataFrame(data).reindex(columns=columns, fill_value="")
+        df["Lead Source"] = "Website Scrape"
+        df["Email Send (Yes/No)"] = "No"
 
     if source_url and "Source URL" in base_cols_no_sn:
         df["Source URL"] = source_url
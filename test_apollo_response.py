@@ -2,7 +2,9 @@
 Diagnostic script to test Apollo API and see what fields are returned.
 """
 
+import os
 import json
+from pathlib import Path
 from apollo import ApolloClient
 from config import load_config
 
@@ -67,10 +69,12 @@ try:
             if result.get("Apollo Company: Employee Range"):
                 print(f"   (But Employee Range is available: {result['Apollo Company: Employee Range']})")
 
-        # Save full response to file
-        with open('apollo_response_sample.json', 'w') as f:
-            json.dump(result, f, indent=2)
-        print(f"\n💾 Full response saved to: apollo_response_sample.json")
+        # Save full response to file (opt-in: set APOLLO_DEBUG_DUMP=1)
+        if os.environ.get("APOLLO_DEBUG_DUMP"):
+            Path("apollo_response_sample.json").write_text(
+                json.dumps(result, indent=2), encoding="utf-8"
+            )
+            print(f"\n💾 Full response saved to: apollo_response_sample.json")
 
     else:
         print("❌ No results returned")
@@ -78,7 +78,9 @@ def sample_records() -> list:
     ]
 
 
-@pytest.fixture
+# Excel fixtures are written once per session: tests only read them, and
+# writing a workbook costs far more than parsing it
+@pytest.fixture(scope="session")
 def sample_excel_path() -> Generator[str, None, None]:
     """
     Create a sample Excel file for testing.
@@ -107,7 +109,7 @@ def sample_excel_path() -> Generator[str, None, None]:
         os.unlink(path)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def excel_no_email_path() -> Generator[str, None, None]:
     """Excel file with no email column (e.g. only First Name, Company)."""
     df = pd.DataFrame({
@@ -123,7 +125,7 @@ def excel_no_email_path() -> Generator[str, None, None]:
         os.unlink(path)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def excel_empty_path() -> Generator[str, None, None]:
     """Excel file with headers only, no data rows."""
     df = pd.DataFrame({
@@ -140,7 +142,7 @@ def excel_empty_path() -> Generator[str, None, None]:
         os.unlink(path)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def excel_all_invalid_email_path() -> Generator[str, None, None]:
     """Excel file with email column but all invalid/empty emails."""
     df = pd.DataFrame({
@@ -155,7 +157,7 @@ def excel_all_invalid_email_path() -> Generator[str, None, None]:
         os.unlink(path)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def excel_multiple_sheets_path() -> Generator[str, None, None]:
     """Excel file with two sheets (first has email column)."""
     df1 = pd.DataFrame({
@@ -173,7 +175,7 @@ def excel_multiple_sheets_path() -> Generator[str, None, None]:
         os.unlink(path)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def excel_duplicate_columns_path() -> Generator[str, None, None]:
     """Excel file with duplicate column names (e.g. two Email columns)."""
     # pandas forces unique column names; use openpyxl to write duplicate headers
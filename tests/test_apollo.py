@@ -2,15 +2,25 @@
 Tests for Apollo API client.
 """
 
+import json
+
 import pytest
 import responses
+import apollo
 from apollo import (
-    ApolloClient, ApolloAPIError,
-    map_apollo_person_response, map_apollo_company_response
+    ApolloClient, ApolloAPIError, ResponseCache,
+    map_apollo_person_response, map_apollo_person_responses,
+    map_apollo_company_response
 )
 from config import config
 
 
+@pytest.fixture(autouse=True)
+def no_backoff_sleep(monkeypatch):
+    """Skip real retry sleeps so retry tests run in milliseconds."""
+    monkeypatch.setattr("apollo.time.sleep", lambda secs: None)
+
+
 class TestApolloClientInitialization:
     """Tests for Apollo client initialization."""
 
@@ -81,6 +91,35 @@ class TestPeopleEnrichment:
         assert len(responses.calls) == 2  # Verify retry occurred
 
 
+class TestConcurrentBatches:
+    """Tests for concurrent batch dispatch."""
+
+    @responses.activate
+    def test_concurrent_batches_preserve_input_order(self, monkeypatch):
+        """Results line up with input records even when batches run in parallel."""
+        monkeypatch.setattr(config, "APOLLO_CONCURRENCY", 4)
+
+        def echo_matches(request):
+            details = json.loads(request.body)["details"]
+            matches = [{"first_name": d["first_name"], "title": "Engineer"} for d in details]
+            return 200, {}, json.dumps({"matches": matches})
+
+        responses.add_callback(
+            responses.POST,
+            f"{config.APOLLO_BASE_URL}/people/bulk_match",
+            callback=echo_matches,
+            content_type="application/json",
+        )
+
+        client = ApolloClient(api_key="test_key")
+        records = [{"First Name": f"P{i}", "Last Name": "X"} for i in range(35)]
+        results = client.enrich_people_bulk(records)
+
+        assert len(responses.calls) == 4
+        assert [r["First Name"] for r in results] == [f"P{i}" for i in range(35)]
+        assert all(r["Job Title"] == "Engineer" for r in results)
+
+
 class TestOrganizationEnrichment:
     """Tests for organization enrichment."""
 
@@ -161,6 +200,30 @@ class TestRetryLogic:
         assert len(results) == 1
         assert "_enrichment_error" in results[0]
 
+    @responses.activate
+    def test_retry_after_header_sets_delay(self, monkeypatch, mock_apollo_people_response):
+        """Test a 429 Retry-After value is used as the retry delay."""
+        sleeps = []
+        monkeypatch.setattr("apollo.time.sleep", sleeps.append)
+        responses.add(
+            responses.POST,
+            f"{config.APOLLO_BASE_URL}/people/bulk_match",
+            json={"error": "Rate limited"},
+            status=429,
+            headers={"Retry-After": "2"}
+        )
+        responses.add(
+            responses.POST,
+            f"{config.APOLLO_BASE_URL}/people/bulk_match",
+            json=mock_apollo_people_response,
+            status=200
+        )
+
+        client = ApolloClient(api_key="test_key")
+        client.enrich_people_bulk([{"First Name": "John", "Last Name": "Doe"}])
+
+        assert sleeps == [2.0]
+
     @responses.activate
     def test_client_error_no_retry(self):
         """Test that client errors (4xx) don't retry."""
@@ -181,6 +244,86 @@ class TestRetryLogic:
         assert "_enrichment_error" in results[0]
 
 
+class TestResponseCache:
+    """Tests for the Apollo response cache."""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        apollo._RESPONSE_CACHE.clear()
+        yield
+        apollo._RESPONSE_CACHE.clear()
+
+    @responses.activate
+    def test_repeat_lookup_served_from_cache(self, monkeypatch, mock_apollo_people_response):
+        """Test a repeated person lookup skips the API in readWrite mode."""
+        monkeypatch.setattr(config, "APOLLO_CACHE_MODE", "readWrite")
+        responses.add(
+            responses.POST,
+            f"{config.APOLLO_BASE_URL}/people/bulk_match",
+            json=mock_apollo_people_response,
+            status=200
+        )
+
+        client = ApolloClient(api_key="test_key")
+        records = [{"First Name": "John", "Last Name": "Doe", "S.N.": "1"}]
+        first = client.enrich_people_bulk(records)
+        second = client.enrich_people_bulk([{**records[0], "S.N.": "2"}])
+
+        assert len(responses.calls) == 1
+        assert second[0]["Job Title"] == first[0]["Job Title"]
+        assert second[0]["S.N."] == "2"
+
+    @responses.activate
+    def test_cache_not_shared_across_api_keys(self, monkeypatch, mock_apollo_people_response):
+        """Test clients with different API keys do not reuse each other's matches."""
+        monkeypatch.setattr(config, "APOLLO_CACHE_MODE", "readWrite")
+        responses.add(
+            responses.POST,
+            f"{config.APOLLO_BASE_URL}/people/bulk_match",
+            json=mock_apollo_people_response,
+            status=200
+        )
+
+        records = [{"First Name": "John", "Last Name": "Doe"}]
+        ApolloClient(api_key="key_a").enrich_people_bulk(records)
+        ApolloClient(api_key="key_b").enrich_people_bulk(records)
+
+        assert len(responses.calls) == 2
+        assert responses.calls[1].request.headers["X-Api-Key"] == "key_b"
+
+    @responses.activate
+    def test_cache_off_by_default(self, mock_apollo_people_response):
+        """Test every lookup hits the API when the cache mode is off."""
+        responses.add(
+            responses.POST,
+            f"{config.APOLLO_BASE_URL}/people/bulk_match",
+            json=mock_apollo_people_response,
+            status=200
+        )
+
+        client = ApolloClient(api_key="test_key")
+        records = [{"First Name": "John", "Last Name": "Doe"}]
+        client.enrich_people_bulk(records)
+        client.enrich_people_bulk(records)
+
+        assert len(responses.calls) == 2
+
+    def test_entries_expire_and_evict(self, monkeypatch):
+        """Test TTL expiry and LRU eviction."""
+        now = [100.0]
+        monkeypatch.setattr(apollo.time, "monotonic", lambda: now[0])
+        cache = ResponseCache(ttl=10, maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        now[0] += 11
+        assert cache.get("c") is None
+
+
 class TestResponseMapping:
     """Tests for response mapping functions."""
 
@@ -201,6 +344,16 @@ class TestResponseMapping:
         assert mapped["Apollo Person: Seniority"] == "senior"
         assert "Apollo Person: Departments" in mapped
 
+    def test_map_person_responses_batch(self, mock_apollo_people_response):
+        """Test batch mapping keeps order and maps unmatched entries to {}."""
+        person_data = mock_apollo_people_response["matches"][0]
+        mapped = map_apollo_person_responses([person_data, None])
+
+        assert len(mapped) == 2
+        assert mapped[1] == {}
+        expected = map_apollo_person_response(person_data)
+        assert {k: mapped[0][k] for k in expected} == expected
+
     def test_map_company_response(self, mock_apollo_org_response):
         """Test mapping company API response."""
         org_data = mock_apollo_org_response["matches"][0]
@@ -251,3 +404,12 @@ class TestBackoffCalculation:
         # Should cap at max backoff
         backoff_max = client._calculate_backoff(10)
         assert backoff_max == config.APOLLO_MAX_BACKOFF
+
+    def test_jittered_backoff_within_bounds(self):
+        """Jittered backoff stays between the base backoff and +50%."""
+        client = ApolloClient(api_key="test_key")
+
+        for attempt in range(4):
+            base = client._calculate_backoff(attempt)
+            for _ in range(20):
+                assert base <= client._jittered_backoff(attempt) <= base * 1.5
@@ -139,6 +139,44 @@ class TestBatchUpsert:
         assert stats["inserted"] == 0
         assert stats["updated"] == 0
 
+    def test_upsert_batch_merges_repeated_email_and_flags_missing(self, db_manager, sample_records):
+        """Test a repeated email within one batch merges into the first and missing emails fail."""
+        first = dict(sample_records[0], **{"Job Title": ""})
+        repeat = dict(sample_records[0], **{"Job Title": "CTO"})
+        sns, stats = db_manager.upsert_batch([first, repeat, {"First Name": "No Email"}])
+
+        assert sns[0] == sns[1] > 0
+        assert sns[2] == -1
+        assert stats["inserted"] == 1
+        assert stats["updated"] == 1
+        assert stats["failed"] == 1
+        retrieved = db_manager.get_existing_record(first["Email ID (unique)"])
+        assert retrieved["Job Title"] == "CTO"
+
+    def test_upsert_batch_larger_than_lookup_chunk(self, db_manager, monkeypatch):
+        """Test existing-row lookups are split across several IN queries."""
+        monkeypatch.setattr("db.EMAIL_LOOKUP_CHUNK", 2)
+        records = [{"Email ID (unique)": f"user{i}@example.com"} for i in range(5)]
+        sns, stats = db_manager.upsert_batch(records)
+        assert stats["inserted"] == 5
+        assert len(set(sns)) == 5
+
+        _, stats = db_manager.upsert_batch(records)
+        assert stats["inserted"] == 0
+
+    def test_upsert_batch_fallback_keeps_timestamp(self, db_manager, sample_records, monkeypatch):
+        """Test the per-record fallback stamps rows with the batch timestamp."""
+        def fail(*args, **kwargs):
+            raise RuntimeError("batched write failed")
+
+        monkeypatch.setattr(db_manager._backend, "_write_batch", fail)
+        _, stats = db_manager.upsert_batch(sample_records, timestamp="2026-01-01T00:00:00Z")
+
+        assert stats["inserted"] == len(sample_records)
+        for record in sample_records:
+            retrieved = db_manager.get_existing_record(record["Email ID (unique)"])
+            assert retrieved["UPDATE AS ON"] == "2026-01-01T00:00:00Z"
+
 
 class TestApolloColumns:
     """Tests for dynamic Apollo column management."""
@@ -219,6 +257,26 @@ class TestSearchRecords:
         assert len(records) == 1
         assert "Example" in records[0]["Company Name (Based on Website Domain)"]
 
+    def test_search_substring_and_prefix(self, db_manager, sample_records):
+        """Test filters match anywhere by default and as prefixes with a leading "^"."""
+        db_manager.upsert_batch(sample_records)
+
+        records, _ = db_manager.search_records(filters={"Email ID (unique)": "acme"})
+        assert [r["Email ID (unique)"] for r in records] == ["jane.smith@acme.org"]
+
+        records, _ = db_manager.search_records(filters={"Email ID (unique)": "^acme"})
+        assert records == []
+
+        records, _ = db_manager.search_records(filters={"Email ID (unique)": "^JANE"})
+        assert [r["Email ID (unique)"] for r in records] == ["jane.smith@acme.org"]
+
+    def test_search_unindexed_column_matches_substring(self, db_manager, sample_records):
+        """Test columns without a NOCASE index match substrings too."""
+        db_manager.upsert_batch(sample_records)
+
+        records, _ = db_manager.search_records(filters={"Job Title": "engineer"})
+        assert [r["Email ID (unique)"] for r in records] == ["john.doe@example.com"]
+
     def test_search_pagination(self, db_manager, sample_records):
         """Test search pagination."""
         db_manager.upsert_batch(sample_records)
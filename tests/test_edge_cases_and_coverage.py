@@ -8,11 +8,17 @@ import pytest
 import pandas as pd
 import responses
 
+import scraper
+
 from scraper import (
     _normalize_item,
     _truncate_html,
+    _strip_boilerplate,
     _fetch_html,
     _extract_from_html_with_llm,
+    _extract_from_html_structured,
+    _llm_cache_get,
+    _llm_cache_put,
     scraped_items_to_truth_rows,
     run_ai_extractor,
     ScraperError,
@@ -23,6 +29,12 @@ from ingest import process_scrape, ExcelIngestor
 from utils import extract_domain
 
 
+@pytest.fixture(autouse=True)
+def reset_openai_client(monkeypatch):
+    """Each test gets a fresh shared OpenAI client so patched classes take effect."""
+    monkeypatch.setattr("scraper._openai_client", None)
+
+
 class TestNormalizeItemEdgeCases:
     def test_organisation_british_spelling(self):
         item = {"firstName": "J", "lastName": "D", "organisation": "Acme"}
@@ -66,21 +78,55 @@ class TestTruncateHtml:
         assert result.endswith("\n[... truncated ...]")
 
 
+class TestStripBoilerplate:
+    def test_removes_scripts_styles_and_noise_attributes(self):
+        html = (
+            '<head><style>p{}</style><script>var x = "<p>";</script></head>'
+            '<!-- nav --><div class="card" data-id="1">  Jane   Doe, <b>Acme</b></div>'
+        )
+        assert _strip_boilerplate(html) == "<head></head><div> Jane Doe, <b>Acme</b></div>"
+
+    def test_removes_nav_and_footer_chrome(self):
+        html = (
+            '<nav><a href="/">Home</a><a href="/team">Team</a></nav>'
+            '<main><p>Jane Doe</p></main><footer>&copy; Acme</footer>'
+        )
+        assert _strip_boilerplate(html) == "<main><p>Jane Doe</p></main>"
+
+
 class TestFetchHtml:
-    @patch("scraper.requests.get")
+    @patch("scraper._SESSION.get")
     def test_success_returns_text(self, mock_get):
-        mock_get.return_value = MagicMock(
+        resp = MagicMock(
             status_code=200,
-            text="<html></html>",
             encoding="utf-8",
             raise_for_status=MagicMock(),
         )
+        resp.iter_content.return_value = iter(["<html>", "</html>"])
+        mock_get.return_value.__enter__.return_value = resp
         result = _fetch_html("https://example.com")
         assert result == "<html></html>"
 
-    @patch("scraper.requests.get")
+    @patch("scraper.config")
+    @patch("scraper._SESSION.get")
+    def test_stops_reading_past_budget(self, mock_get, mock_config):
+        mock_config.MAX_HTML_CHARS = 5
+        resp = MagicMock(encoding="utf-8", raise_for_status=MagicMock())
+        resp.iter_content.return_value = iter(["x" * 10, "y" * 10, "z" * 10])
+        mock_get.return_value.__enter__.return_value = resp
+        result = _fetch_html("https://example.com")
+        assert result == "x" * 10 + "y" * 10
+
+    def test_retry_after_is_capped(self):
+        from urllib3.response import HTTPResponse
+        from scraper import _CappedRetry, HTML_RETRY_AFTER_MAX_SECS
+
+        response = HTTPResponse(status=429, headers={"Retry-After": "3600"})
+        assert _CappedRetry(total=2).get_retry_after(response) == HTML_RETRY_AFTER_MAX_SECS
+
+    @patch("scraper._SESSION.get")
     def test_http_error_returns_none(self, mock_get):
-        mock_get.return_value = MagicMock(
+        mock_get.return_value.__enter__.return_value = MagicMock(
             raise_for_status=MagicMock(side_effect=Exception("404")),
         )
         result = _fetch_html("https://example.com")
@@ -90,18 +136,71 @@ class TestFetchHtml:
 class TestExtractFromHtmlWithLlm:
     @patch("scraper.config")
     @patch("openai.OpenAI")
-    def test_valid_json_array_returns_normalized_list(self, mock_openai_cls, mock_config):
+    def test_structured_items_reply_returns_normalized_list(self, mock_openai_cls, mock_config):
         mock_config.OPENAI_API_KEY = "key"
         mock_config.MAX_HTML_CHARS = 10000
+        mock_config.OPENAI_MAX_RPM = 0
         mock_config.OPENAI_EXTRACTION_MODEL = "gpt-4o-mini"
+        mock_config.OPENAI_EXTRACTION_MODEL_CHEAP = ""
+        mock_config.LLM_CACHE_PATH = ""
         mock_client = MagicMock()
         mock_openai_cls.return_value = mock_client
         mock_client.chat.completions.create.return_value = MagicMock(
-            choices=[MagicMock(message=MagicMock(content='[{"firstName":"J","lastName":"D","organization":"Acme"}]'))]
+            choices=[MagicMock(message=MagicMock(content='{"items":[{"firstName":"J","lastName":"D","organization":"Acme","email":""}]}'))]
         )
         result = _extract_from_html_with_llm("<html>...</html>", "https://example.com")
         assert len(result) == 1
         assert result[0]["firstName"] == "J"
+        kwargs = mock_client.chat.completions.create.call_args.kwargs
+        assert kwargs["response_format"]["type"] == "json_schema"
+        assert kwargs["temperature"] == 0
+
+    @patch("scraper.config")
+    @patch("openai.OpenAI")
+    def test_cached_result_skips_second_api_call(
+        self, mock_openai_cls, mock_config, tmp_path, monkeypatch
+    ):
+        monkeypatch.setattr("scraper._llm_cache", None)
+        mock_config.OPENAI_API_KEY = "key"
+        mock_config.MAX_HTML_CHARS = 10000
+        mock_config.OPENAI_MAX_RPM = 0
+        mock_config.OPENAI_EXTRACTION_MODEL = "gpt-4o-mini"
+        mock_config.OPENAI_EXTRACTION_MODEL_CHEAP = ""
+        mock_config.LLM_CACHE_PATH = str(tmp_path / "llm_cache.db")
+        mock_config.LLM_CACHE_TTL_SECS = 3600
+        mock_client = MagicMock()
+        mock_openai_cls.return_value = mock_client
+        mock_client.chat.completions.create.return_value = MagicMock(
+            choices=[MagicMock(message=MagicMock(
+                content='{"items":[{"firstName":"J","lastName":"D","organization":"Acme","email":""}]}'
+            ))]
+        )
+        first = _extract_from_html_with_llm("<html>same</html>", "https://example.com")
+        second = _extract_from_html_with_llm("<html>same</html>", "https://example.com")
+        assert first == second
+        assert mock_client.chat.completions.create.call_count == 1
+
+    @patch("scraper.config")
+    @patch("openai.OpenAI")
+    def test_cheap_model_escalates_when_it_finds_nothing(self, mock_openai_cls, mock_config):
+        mock_config.OPENAI_API_KEY = "key"
+        mock_config.MAX_HTML_CHARS = 10000
+        mock_config.OPENAI_MAX_RPM = 0
+        mock_config.OPENAI_EXTRACTION_MODEL = "big-model"
+        mock_config.OPENAI_EXTRACTION_MODEL_CHEAP = "small-model"
+        mock_config.LLM_CACHE_PATH = ""
+        mock_client = MagicMock()
+        mock_openai_cls.return_value = mock_client
+        mock_client.chat.completions.create.side_effect = [
+            MagicMock(choices=[MagicMock(message=MagicMock(content='{"items":[]}'))]),
+            MagicMock(choices=[MagicMock(message=MagicMock(
+                content='{"items":[{"firstName":"J","lastName":"D","organization":"Acme","email":""}]}'
+            ))]),
+        ]
+        result = _extract_from_html_with_llm("<html>small page</html>", "https://example.com")
+        models = [c.kwargs["model"] for c in mock_client.chat.completions.create.call_args_list]
+        assert models == ["small-model", "big-model"]
+        assert result[0]["firstName"] == "J"
 
     @patch("scraper.config")
     def test_no_openai_key_returns_empty(self, mock_config):
@@ -110,6 +209,61 @@ class TestExtractFromHtmlWithLlm:
         assert result == []
 
 
+class TestLlmCache:
+    @pytest.fixture(autouse=True)
+    def cache_file(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("scraper._llm_cache", None)
+        monkeypatch.setattr(config, "LLM_CACHE_PATH", str(tmp_path / "llm_cache.db"))
+        monkeypatch.setattr(config, "LLM_CACHE_TTL_SECS", 60)
+        yield
+        scraper._llm_cache.close()
+
+    def test_expired_entries_are_misses_and_pruned(self, monkeypatch):
+        clock = [1000.0]
+        monkeypatch.setattr("scraper.time.time", lambda: clock[0])
+        _llm_cache_put("k", [{"firstName": "J"}])
+        assert _llm_cache_get("k") == [{"firstName": "J"}]
+
+        clock[0] += 61
+        assert _llm_cache_get("k") is None
+        scraper._prune_llm_cache(scraper._llm_cache)
+        assert scraper._llm_cache.execute("SELECT COUNT(*) FROM llm_cache").fetchone()[0] == 0
+
+    def test_oldest_rows_beyond_cap_are_pruned(self, monkeypatch):
+        monkeypatch.setattr("scraper.LLM_CACHE_MAX_ROWS", 2)
+        clock = [1000.0]
+        monkeypatch.setattr("scraper.time.time", lambda: clock[0])
+        for key in ("a", "b", "c"):
+            _llm_cache_put(key, [])
+            clock[0] += 1
+        scraper._prune_llm_cache(scraper._llm_cache)
+        assert [_llm_cache_get(key) for key in ("a", "b", "c")] == [None, [], []]
+
+
+class TestExtractFromHtmlStructured:
+    def test_team_cards_extracted_without_llm(self):
+        html = (
+            '<div class="team-member"><h3>Jane Doe</h3><p>CEO, working at lots of places</p></div>'
+            '<div itemscope itemtype="https://schema.org/Person">'
+            '<span itemprop="name">John Smith</span>'
+            '<span itemprop="worksFor">Acme Corp</span></div>'
+            '<div class="team-member"><h3>Read more about our team members</h3></div>'
+        )
+        result = _extract_from_html_structured(html, "https://example.com/team")
+        assert [(r["firstName"], r["lastName"], r["organization"]) for r in result] == [
+            ("Jane", "Doe", ""),
+            ("John", "Smith", "Acme Corp"),
+        ]
+
+    def test_name_like_classes_are_not_names(self):
+        html = (
+            '<div class="team-member"><span class="company-name">Acme Corp</span>'
+            '<h3>Jane Doe</h3></div>'
+        )
+        result = _extract_from_html_structured(html, "https://example.com/team")
+        assert [(r["firstName"], r["lastName"]) for r in result] == [("Jane", "Doe")]
+
+
 class TestScrapedItemsToTruthRowsEdgeCases:
     def test_source_url_set_when_provided(self):
         items = [{"firstName": "J", "lastName": "D", "organization": "Acme"}]
@@ -143,6 +297,22 @@ class TestRunAiExtractorFlow:
         assert len(result) == 1
         assert result[0]["firstName"] == "J"
 
+    @patch("scraper.config")
+    @patch("scraper._extract_from_html_with_llm")
+    @patch("scraper._extract_from_html_structured")
+    @patch("scraper._fetch_html")
+    def test_structured_items_kept_when_llm_finds_nothing(
+        self, mock_fetch, mock_structured, mock_extract, mock_config
+    ):
+        mock_config.OPENAI_API_KEY = "key"
+        mock_config.ENABLE_HTML_FIRST_EXTRACTION = True
+        mock_fetch.return_value = "<html></html>"
+        mock_structured.return_value = [{"firstName": "Jane", "lastName": "Doe", "organization": ""}]
+        mock_extract.return_value = []
+        result = run_ai_extractor("https://example.com")
+        assert result == mock_structured.return_value
+        mock_extract.assert_called_once()
+
 
 class TestApolloBatchAndOrgEdgeCases:
     @responses.activate
@@ -167,8 +337,11 @@ class TestApolloBatchAndOrgEdgeCases:
         results = client.enrich_people_bulk(records, batch_size=25)
         assert len(results) == 11
         assert len(responses.calls) == 2
-        first_body = json.loads(responses.calls[0].request.body)
-        assert len(first_body["details"]) == 10
+        # Batches may be dispatched concurrently, so compare sizes regardless of order
+        batch_sizes = sorted(
+            len(json.loads(call.request.body)["details"]) for call in responses.calls
+        )
+        assert batch_sizes == [1, 10]
 
     def test_prepare_org_payload_domains_only(self):
         client = ApolloClient(api_key="test_key")
@@ -181,6 +354,34 @@ class TestApolloBatchAndOrgEdgeCases:
         assert "domains" in payload
         assert payload["domains"] == ["example.com", "acme.org"]
 
+    def test_prepare_org_payload_dedupes_domains(self):
+        client = ApolloClient(api_key="test_key")
+        records = [
+            {"Website URLs": "https://www.example.com"},
+            {"Website URLs": "acme.org"},
+            {"Website URLs": "example.com/about"},
+        ]
+        payload = client._prepare_org_payload(records)
+        assert payload["domains"] == ["example.com", "acme.org"]
+
+    @responses.activate
+    def test_org_enrich_sends_each_domain_once(self, mock_apollo_org_response):
+        responses.add(
+            responses.POST,
+            f"{config.APOLLO_BASE_URL}/organizations/bulk_enrich",
+            json=mock_apollo_org_response,
+            status=200,
+        )
+        client = ApolloClient(api_key="test_key")
+        records = [
+            {"First Name": "A", "Website URLs": "example.com"},
+            {"First Name": "B", "Website URLs": "https://www.example.com"},
+        ]
+        results = client.enrich_organizations_bulk(records)
+        assert json.loads(responses.calls[0].request.body)["domains"] == ["example.com"]
+        assert [r["First Name"] for r in results] == ["A", "B"]
+        assert all(r.get("Industry") == "Technology" for r in results)
+
     def test_prepare_org_payload_empty_when_no_domains(self):
         client = ApolloClient(api_key="test_key")
         records = [{"Company Name (Based on Website Domain)": "Acme"}]
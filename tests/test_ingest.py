@@ -4,7 +4,7 @@ Tests for Excel ingestion pipeline.
 
 import pytest
 import pandas as pd
-from ingest import ExcelIngestor
+from ingest import ExcelIngestor, _has_enrichment_failures
 from config import config
 
 
@@ -30,6 +30,41 @@ class TestExcelParsing:
         with pytest.raises(Exception):
             ingestor.parse_excel("/nonexistent/file.xlsx")
 
+    def test_parse_excel_reads_mapped_columns_as_text(self, db_manager, tmp_path):
+        """Unmapped columns are not read and kept columns come back as text."""
+        path = tmp_path / "leads.xlsx"
+        pd.DataFrame({
+            "Email": ["a@b.com"],
+            "Contact Number (Person)": [5551234567],
+            "Internal Notes": ["skip me"],
+        }).to_excel(path, index=False, engine="openpyxl")
+
+        ingestor = ExcelIngestor(db_manager, None)
+        df = ingestor.parse_excel(str(path))
+
+        assert list(df.columns) == ["Email ID (unique)", "Contact Number (Person)"]
+        assert df.iloc[0]["Contact Number (Person)"] == "5551234567"
+
+
+    def test_parse_excel_keeps_apollo_columns_from_export(self, db_manager, tmp_path):
+        """Re-uploading an export keeps its Apollo columns so they are saved again."""
+        path = tmp_path / "export.xlsx"
+        pd.DataFrame({
+            "S.N.": [1],
+            "Email ID (unique)": ["a@b.com"],
+            "Apollo Person: Seniority": ["director"],
+            "Apollo Company: Founded Year": ["2010"],
+        }).to_excel(path, index=False, engine="openpyxl")
+
+        ingestor = ExcelIngestor(db_manager, None)
+        df = ingestor.normalize_dataframe(ingestor.parse_excel(str(path)))
+        ingestor.save_to_database(df)
+
+        assert "Apollo Person: Seniority" in df.columns
+        retrieved = db_manager.get_existing_record("a@b.com")
+        assert retrieved["Apollo Person: Seniority"] == "director"
+        assert retrieved["Apollo Company: Founded Year"] == "2010"
+
 
 class TestColumnDetection:
     """Tests for flexible column detection."""
@@ -65,6 +100,19 @@ class TestColumnDetection:
         assert "Company Name (Based on Website Domain)" in df.columns
         assert "Website URLs" in df.columns
 
+    def test_unknown_columns_keep_original_name(self, db_manager):
+        """Test that unmapped columns pass through and matching ignores case/whitespace."""
+        ingestor = ExcelIngestor(db_manager, None)
+
+        df = pd.DataFrame({
+            "  EMAIL Address ": ["test@example.com"],
+            "Custom Notes": ["keep me"]
+        })
+
+        df = ingestor._detect_and_map_columns(df)
+
+        assert list(df.columns) == ["Email ID (unique)", "Custom Notes"]
+
 
 class TestDataNormalization:
     """Tests for data normalization."""
@@ -124,6 +172,20 @@ class TestDataNormalization:
 
         assert df.iloc[0]["Lead Source"] == "Website Scrape"
 
+    def test_normalize_fills_text_columns_keeps_numeric(self, db_manager):
+        """Truth columns get empty strings for missing values; numeric extras keep dtype."""
+        ingestor = ExcelIngestor(db_manager, None)
+
+        df = pd.DataFrame({
+            "Email ID (unique)": ["a@example.com", "b@example.com"],
+            "Country": ["India", None],
+            "Score": [1.5, 2.5],
+        })
+        df = ingestor.normalize_dataframe(df)
+
+        assert df.iloc[1]["Country"] == ""
+        assert df["Score"].dtype == "float64"
+
 
 class TestDeduplication:
     """Tests for email deduplication."""
@@ -205,6 +267,21 @@ class TestSaveToDatabase:
         # Should only save one record
         assert stats["inserted"] == 1
 
+    def test_save_in_chunks_accumulates_stats(self, db_manager):
+        """Test that chunked saving sums stats across chunks."""
+        ingestor = ExcelIngestor(db_manager, None)
+
+        df = pd.DataFrame({
+            "Email ID (unique)": ["a@example.com", "", "b@example.com"],
+            "First Name": ["Alice", "Nobody", "Bob"]
+        })
+
+        stats = ingestor.save_to_database(df, chunk_size=1)
+
+        assert stats["inserted"] == 2
+        assert stats["skipped_no_email"] == 1
+        assert stats["inserted_emails"] == ["a@example.com", "b@example.com"]
+
 
 class TestProgressCallback:
     """Tests for progress callback functionality."""
@@ -292,6 +369,43 @@ class TestMergeEnrichedData:
         assert df.iloc[0]["Job Title"] == "Engineer"
 
 
+class TestEnrichmentSnapshot:
+    """Enriched snapshots are only kept when every Apollo call succeeded."""
+
+    def test_skipped_rows_are_not_failures(self):
+        df = pd.DataFrame({
+            "_enrichment_error": [None, "", "Skipped (no identifier for matching)"],
+        })
+        assert not _has_enrichment_failures(df)
+        assert not _has_enrichment_failures(pd.DataFrame({"a": [1]}))
+
+    def test_api_error_is_a_failure(self):
+        df = pd.DataFrame({"_enrichment_error": [None, "Max retries exceeded"]})
+        assert _has_enrichment_failures(df)
+
+    def test_failed_enrichment_not_snapshotted(self, db_manager, sample_excel_path, monkeypatch):
+        ingestor = ExcelIngestor(db_manager, apollo_client=object())
+        monkeypatch.setattr(ingestor, "_cache_key", lambda path: "key")
+        monkeypatch.setattr(
+            ingestor, "enrich_records",
+            lambda df, *args: (df.assign(_enrichment_error="429 Too Many Requests"), {}),
+        )
+        written = []
+        monkeypatch.setattr(
+            ingestor, "_write_snapshot", lambda df, key, stage: written.append(stage)
+        )
+        ingestor.process_file(sample_excel_path)
+        assert written == ["normalized"]
+
+    def test_cache_key_includes_snapshot_version(self, db_manager, sample_excel_path, monkeypatch):
+        monkeypatch.setattr(config, "CACHE_DIR", "unused")
+        ingestor = ExcelIngestor(db_manager, None)
+        key = ingestor._cache_key(sample_excel_path)
+
+        monkeypatch.setattr("ingest.SNAPSHOT_VERSION", -1)
+        assert ingestor._cache_key(sample_excel_path) != key
+
+
 class TestNoEmailColumn:
     """Tests for missing email column (fail fast, no wasted API calls)."""
 
@@ -2,12 +2,14 @@
 Tests for utility functions.
 """
 
+import logging
 import pytest
 from utils import (
-    mask_pii, extract_domain, get_utc_timestamp,
+    mask_pii, mask_pii_series, extract_domain, get_utc_timestamp,
     validate_email, normalize_company_name, clean_phone_number,
     chunk_list, safe_dict_get, flatten_list_to_string,
-    safe_int, safe_str
+    safe_int, safe_str, json_loads, json_dumps_bytes, PIIMaskingFilter,
+    setup_logging
 )
 
 
@@ -41,6 +43,70 @@ class TestMaskPII:
         masked = mask_pii(text)
         assert masked == text
 
+    def test_mask_series_matches_scalar(self):
+        """Series masking gives the same result as mask_pii per value."""
+        pd = pytest.importorskip("pandas")
+        texts = ["Contact user@example.com", "Call +1-555-123-4567", "plain", None]
+        masked = mask_pii_series(pd.Series(texts, dtype="object"))
+        assert masked.tolist()[:3] == [mask_pii(t) for t in texts[:3]]
+        assert masked.isna().tolist()[3]
+
+
+class TestPIIMaskingFilter:
+    """Tests for the PII masking log filter."""
+
+    @staticmethod
+    def _record(msg, args):
+        return logging.LogRecord("test", logging.INFO, __file__, 1, msg, args, None)
+
+    def test_masks_tuple_args(self):
+        """Test string arguments are masked and other arguments kept."""
+        record = self._record("%s called %s (%d)", ("john@test.com", "+1-555-123-4567", 3))
+        PIIMaskingFilter().filter(record)
+        message = record.getMessage()
+        assert "john@test.com" not in message
+        assert "555-123" not in message
+        assert message.endswith("(3)")
+
+    def test_masks_dict_args(self):
+        """Test a mapping argument for %(name)s formatting is masked."""
+        # As logger.info("%(email)s", {"email": ...}) builds it
+        record = self._record("%(email)s", ({"email": "john@test.com"},))
+        PIIMaskingFilter().filter(record)
+        assert record.getMessage() == "j***@t***.com"
+
+    def test_args_without_pii_left_as_is(self):
+        """Test args are not replaced when nothing needs masking."""
+        args = ("plain", 42)
+        record = self._record("%s %s", args)
+        PIIMaskingFilter().filter(record)
+        assert record.args is args
+
+
+class TestSetupLogging:
+    """Tests for the pipeline logger configuration."""
+
+    def test_logger_masks_records_before_handlers(self):
+        """Test records logged on the pipeline logger reach any handler masked."""
+        logger = logging.getLogger("apollo_pipeline")
+        saved_handlers, saved_level = list(logger.handlers), logger.level
+        messages = []
+
+        class Capture(logging.Handler):
+            def emit(self, record):
+                messages.append(record.getMessage())
+
+        try:
+            setup_logging("INFO", log_to_console=False)
+            logger.addHandler(Capture())
+            logger.info("Enriching %s", "john@test.com")
+            logger.info("%(phone)s", {"phone": "+1-555-123-4567"})
+        finally:
+            logger.handlers[:] = saved_handlers
+            logger.setLevel(saved_level)
+
+        assert messages == ["Enriching j***@t***.com", "+*-***-***-**67"]
+
 
 class TestExtractDomain:
     """Tests for domain extraction."""
@@ -60,6 +126,14 @@ class TestExtractDomain:
         assert extract_domain("") is None
         assert extract_domain(None) is None
 
+    def test_urlparse_edge_cases(self):
+        """Test inputs where a plain string scan would differ from urlparse."""
+        assert extract_domain("https://exa\tmple.com/x") == "example.com"
+        assert extract_domain("exam\r\nple.com") == "example.com"
+        assert extract_domain("https:///x") == "/x"
+        assert extract_domain("https://[::1") is None
+        assert extract_domain("http://[bad/x") is None
+
 
 class TestValidateEmail:
     """Tests for email validation."""
@@ -192,6 +266,11 @@ class TestSafeInt:
         assert safe_int("not a number", 0) == 0
         assert safe_int(None, -1) == -1
 
+    def test_convert_non_finite_float(self):
+        """NaN and infinity fall back to the default instead of raising."""
+        assert safe_int(float("nan"), 7) == 7
+        assert safe_int(float("inf"), 7) == 7
+
 
 class TestSafeStr:
     """Tests for safe string conversion."""
@@ -220,3 +299,21 @@ class TestGetUtcTimestamp:
         assert "T" in timestamp
         assert timestamp.endswith("Z")
         assert len(timestamp) == 20  # ISO 8601 format
+
+
+class TestJson:
+    """Tests for the JSON helpers (orjson when installed, stdlib json otherwise)."""
+
+    def test_round_trip(self):
+        """Test bytes from json_dumps_bytes parse back to the same object."""
+        obj = {"name": "José", "items": [1, 2.5, None, True]}
+        data = json_dumps_bytes(obj)
+        assert isinstance(data, bytes)
+        assert json_loads(data) == obj
+        assert json_loads(data.decode("utf-8")) == obj
+
+    def test_stdlib_fallback(self, monkeypatch):
+        """Test the helpers work without orjson."""
+        monkeypatch.setattr("utils.orjson", None)
+        assert json_dumps_bytes({"a": [1]}) == b'{"a":[1]}'
+        assert json_loads(b'{"a":[1]}') == {"a": [1]}
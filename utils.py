@@ -4,10 +4,44 @@ Includes PII masking, data validation, normalization, and logging setup.
 """
 
 import re
+import json
+import time
+import string
 import logging
-from typing import Optional, Iterator, List, Any
-from datetime import datetime
+from functools import lru_cache
 from urllib.parse import urlparse
+from typing import TYPE_CHECKING, Optional, Iterator, List, Any, Union
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# orjson encodes/decodes several times faster than stdlib json; optional
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# mask_pii patterns, compiled once rather than looked up per call
+_EMAIL_MASK_RE = re.compile(
+    r'\b([a-zA-Z0-9])[a-zA-Z0-9._%+-]*@([a-zA-Z0-9])[a-zA-Z0-9.-]*\.[a-zA-Z]{2,}\b'
+)
+# Phone formats, fused into one alternation so the text is scanned once
+# (earlier alternatives win at a given position)
+_PHONE_PATTERNS = (
+    r'\+\d{1,3}[-.\s]?\(?\d{1,4}\)?[-.\s]?\d{1,4}[-.\s]?\d{1,9}',  # International
+    r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}',  # US format
+    r'\d{3}[-.\s]?\d{3}[-.\s]?\d{4}',  # Simple format
+)
+_PHONE_RE = re.compile('|'.join(f'(?:{p})' for p in _PHONE_PATTERNS))
+_EMAIL_MASK_REPL = r'\1***@\2***.com'
+_DIGIT_RE = re.compile(r'\d')
+_DIGIT_TO_STAR = str.maketrans('0123456789', '*' * 10)
+_NON_DIGIT_RE = re.compile(r'[^\d]')
+_NON_PHONE_CHAR_RE = re.compile(r'[^\d+]')
+# Deletes every ASCII character except digits and "+" (clean_phone_number)
+_PHONE_ASCII_STRIP = str.maketrans('', '', ''.join(
+    chr(c) for c in range(128) if chr(c) not in '0123456789+'
+))
 
 
 def mask_pii(text: str) -> str:
@@ -27,35 +61,51 @@ def mask_pii(text: str) -> str:
     if not text:
         return text
 
-    # Mask email addresses
-    email_pattern = r'\b([a-zA-Z0-9])[a-zA-Z0-9._%+-]*@([a-zA-Z0-9])[a-zA-Z0-9.-]*\.[a-zA-Z]{2,}\b'
-    text = re.sub(email_pattern, r'\1***@\2***.com', text)
-
-    # Mask phone numbers (various formats)
-    phone_patterns = [
-        r'\+\d{1,3}[-.\s]?\(?\d{1,4}\)?[-.\s]?\d{1,4}[-.\s]?\d{1,9}',  # International
-        r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}',  # US format
-        r'\d{3}[-.\s]?\d{3}[-.\s]?\d{4}',  # Simple format
-    ]
-
-    for pattern in phone_patterns:
-        matches = re.finditer(pattern, text)
-        for match in matches:
-            phone = match.group()
-            # Keep first and last 2 digits if long enough
-            if len(re.sub(r'[^\d]', '', phone)) >= 4:
-                masked = re.sub(r'\d', '*', phone[:-2]) + phone[-2:]
-            else:
-                masked = '*' * len(phone)
-            text = text.replace(phone, masked)
+    # Mask email addresses (none without an "@"; a substring check is far
+    # cheaper than the regex scan, and most log lines have no PII)
+    if '@' in text:
+        text = _EMAIL_MASK_RE.sub(_EMAIL_MASK_REPL, text)
 
-    return text
+    # Mask phone numbers (various formats; none without a digit)
+    if _DIGIT_RE.search(text) is None:
+        return text
+    return _PHONE_RE.sub(_mask_phone, text)
+
+
+def mask_pii_series(series: "pd.Series") -> "pd.Series":
+    """
+    Column-wise mask_pii for a pandas Series of strings (missing values kept).
 
+    Args:
+        series: Series of text that may contain emails or phone numbers
+
+    Returns:
+        Series with PII masked
+    """
+    series = series.str.replace(_EMAIL_MASK_RE, _EMAIL_MASK_REPL, regex=True)
+    return series.str.replace(_PHONE_RE, _mask_phone, regex=True)
 
+
+def _mask_phone(match: "re.Match[str]") -> str:
+    """Mask a matched phone number, keeping the last 2 digits if it has at least 4."""
+    phone = match.group()
+    if len(_NON_DIGIT_RE.sub('', phone)) >= 4:
+        head = phone[:-2]
+        # ASCII digits (the usual case) are starred by table; \d also matches
+        # other scripts' digits, which need the regex
+        head = head.translate(_DIGIT_TO_STAR) if head.isascii() else _DIGIT_RE.sub('*', head)
+        return head + phone[-2:]
+    return '*' * len(phone)
+
+
+@lru_cache(maxsize=65536)
 def extract_domain(url: str) -> Optional[str]:
     """
     Extract clean domain from URL.
 
+    Results are memoized (bounded LRU) since enrichment batches repeat the
+    same company website across many rows.
+
     Examples:
         https://www.example.com/path -> example.com
         http://subdomain.example.co.uk -> subdomain.example.co.uk
@@ -87,6 +137,10 @@ def extract_domain(url: str) -> Optional[str]:
         return None
 
 
+# (epoch second, formatted timestamp) from the latest get_utc_timestamp call
+_last_timestamp = (0, "")
+
+
 def get_utc_timestamp() -> str:
     """
     Get current UTC timestamp in ISO 8601 format.
@@ -94,12 +148,24 @@ def get_utc_timestamp() -> str:
     Returns:
         UTC timestamp string (e.g., "2026-01-29T10:30:45Z")
     """
-    return datetime.utcnow().strftime('%Y-%m-%dT%H:%M:%SZ')
+    global _last_timestamp
+    second = int(time.time())
+    cached_second, text = _last_timestamp
+    # Formatting is reused within the same second (one tuple swap, thread-safe)
+    if second != cached_second:
+        text = time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime(second))
+        _last_timestamp = (second, text)
+    return text
 
 
 # RFC 5321 max length for email (254)
 EMAIL_MAX_LENGTH = 254
 
+# Accepted email shape (also used for vectorized validation in ingest)
+EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_EMAIL_LOCAL_CHARS = frozenset(string.ascii_letters + string.digits + '._%+-')
+_EMAIL_DOMAIN_CHARS = frozenset(string.ascii_letters + string.digits + '.-')
+
 
 def validate_email(email: Optional[str]) -> bool:
     """
@@ -118,8 +184,17 @@ def validate_email(email: Optional[str]) -> bool:
     s = email.strip()
     if len(s) > EMAIL_MAX_LENGTH:
         return False
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return bool(re.match(pattern, s))
+
+    # Same acceptor as EMAIL_PATTERN, walked with set checks instead of the
+    # regex: local@domain.tld where tld follows the last dot
+    local, at, domain = s.partition('@')
+    if not at or not local or not _EMAIL_LOCAL_CHARS.issuperset(local):
+        return False
+    if not _EMAIL_DOMAIN_CHARS.issuperset(domain):
+        return False
+    dot = domain.rfind('.')
+    tld = domain[dot + 1:]
+    return dot > 0 and len(tld) >= 2 and tld.isascii() and tld.isalpha()
 
 
 def normalize_company_name(name: str) -> str:
@@ -139,8 +214,12 @@ def normalize_company_name(name: str) -> str:
     if not name:
         return ""
 
-    # Strip and remove extra whitespace
-    name = ' '.join(name.strip().split())
+    # Strip and remove extra whitespace; already-clean names (no double
+    # spaces, and no tabs/newlines/other whitespace, all non-printable) skip
+    # the split/join
+    name = name.strip()
+    if '  ' in name or not name.isprintable():
+        name = ' '.join(name.split())
 
     # Title case
     return name.title()
@@ -159,10 +238,14 @@ def clean_phone_number(phone: str) -> str:
     if not phone:
         return ""
 
-    # Remove all non-digit and non-plus characters
-    cleaned = re.sub(r'[^\d+]', '', phone)
+    # ASCII input (the usual case): one table-driven pass keeps digits and "+"
+    cleaned = phone.translate(_PHONE_ASCII_STRIP)
+    if cleaned.isascii():
+        return cleaned
 
-    return cleaned
+    # Non-ASCII left over (e.g. other scripts' digits): remove all non-digit
+    # and non-plus characters
+    return _NON_PHONE_CHAR_RE.sub('', phone)
 
 
 def chunk_list(items: List[Any], chunk_size: int) -> Iterator[List[Any]]:
@@ -196,18 +279,28 @@ def safe_dict_get(d: dict, key_path: str, default: Any = None) -> Any:
     Returns:
         Value at key path or default
     """
-    keys = key_path.split('.')
     value = d
 
-    for key in keys:
-        if isinstance(value, dict) and key in value:
-            value = value[key]
-        else:
+    for key in _split_path(key_path):
+        if not isinstance(value, dict):
+            return default
+        # One hash probe; the sentinel tells a missing key from a None value
+        value = value.get(key, _MISSING)
+        if value is _MISSING:
             return default
 
     return value
 
 
+_MISSING = object()
+
+
+@lru_cache(maxsize=4096)
+def _split_path(key_path: str) -> tuple:
+    """Dot-separated path split into keys, cached since callers reuse a few fixed paths."""
+    return tuple(key_path.split('.'))
+
+
 class PIIMaskingFilter(logging.Filter):
     """
     Logging filter that automatically masks PII in all log records.
@@ -226,16 +319,29 @@ class PIIMaskingFilter(logging.Filter):
         if isinstance(record.msg, str):
             record.msg = mask_pii(record.msg)
 
-        # Also mask any string arguments
-        if record.args:
-            record.args = tuple(
-                mask_pii(str(arg)) if isinstance(arg, str) else arg
-                for arg in record.args
-            )
+        # Also mask any string arguments, each once; record.args is only
+        # replaced when something changed (most records carry no PII)
+        args = record.args
+        if isinstance(args, tuple):
+            masked = tuple(mask_pii(arg) if isinstance(arg, str) else arg for arg in args)
+            if masked != args:
+                record.args = masked
+        elif isinstance(args, dict):
+            # Single mapping argument for "%(name)s" formatting
+            masked = {
+                key: mask_pii(arg) if isinstance(arg, str) else arg
+                for key, arg in args.items()
+            }
+            if masked != args:
+                record.args = masked
 
         return True
 
 
+# Stateless, so one instance serves every setup_logging call
+_PII_FILTER = PIIMaskingFilter()
+
+
 def setup_logging(
     log_level: str = "INFO",
     log_file: Optional[str] = None,
@@ -264,21 +370,21 @@ def setup_logging(
         datefmt='%Y-%m-%d %H:%M:%S'
     )
 
-    # Add PII masking filter
-    pii_filter = PIIMaskingFilter()
+    # Add PII masking filter on the logger itself: it runs once per record
+    # before fan-out to handlers (also covering propagation to root handlers),
+    # and the shared instance is not re-added on repeated setup calls
+    logger.addFilter(_PII_FILTER)
 
     # Console handler
     if log_to_console:
         console_handler = logging.StreamHandler()
         console_handler.setFormatter(formatter)
-        console_handler.addFilter(pii_filter)
         logger.addHandler(console_handler)
 
     # File handler
     if log_file:
         file_handler = logging.FileHandler(log_file)
         file_handler.setFormatter(formatter)
-        file_handler.addFilter(pii_filter)
         logger.addHandler(file_handler)
 
     return logger
@@ -298,7 +404,12 @@ def flatten_list_to_string(items: List[Any], separator: str = ", ") -> str:
     if not items:
         return ""
 
-    return separator.join(str(item) for item in items if item)
+    # All-str lists (the usual case) need no str() calls; filter(None, ...)
+    # drops empty items in C
+    if all(type(item) is str for item in items):
+        return separator.join(filter(None, items))
+    # List comprehension: join builds a list from a generator first anyway
+    return separator.join([str(item) for item in items if item])
 
 
 def safe_int(value: Any, default: int = 0) -> int:
@@ -312,9 +423,15 @@ def safe_int(value: Any, default: int = 0) -> int:
     Returns:
         Integer value or default
     """
+    # Common cases first: already an int, or missing (no exception raised)
+    if type(value) is int:
+        return value
+    if value is None:
+        return default
     try:
         return int(value)
-    except (ValueError, TypeError):
+    except (ValueError, TypeError, OverflowError):
+        # OverflowError: float infinity (e.g. "Infinity" in a JSON response)
         return default
 
 
@@ -331,4 +448,20 @@ def safe_str(value: Any, default: str = "") -> str:
     """
     if value is None:
         return default
+    if isinstance(value, str):
+        return value.strip()
     return str(value).strip()
+
+
+def json_loads(data: Union[str, bytes]) -> Any:
+    """Parse JSON text or UTF-8 bytes, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps_bytes(obj: Any) -> bytes:
+    """Serialize obj to compact UTF-8 JSON bytes, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")